@@ -97,6 +97,10 @@ class Settings(BaseSettings):
         default=None,
         description="Override SQL echo setting (defaults to True in dev/test)",
     )
+    log_tracebacks: bool | None = Field(
+        default=None,
+        description="Override traceback logging for tool errors (defaults to True in dev/test)",
+    )
 
     @field_validator("auth_provider")
     @classmethod
@@ -156,6 +160,13 @@ class Settings(BaseSettings):
             return self.sql_echo
         return not self.is_production
 
+    @property
+    def include_tracebacks(self) -> bool:
+        """Determine if tool error logs should include tracebacks."""
+        if self.log_tracebacks is not None:
+            return self.log_tracebacks
+        return not self.is_production
+
 
 @lru_cache
 def get_settings() -> Settings:
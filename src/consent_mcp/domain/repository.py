@@ -32,6 +32,23 @@ class IConsentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, requests: list[ConsentRequest]) -> list[ConsentRequest]:
+        """
+        Create several consent requests in one batch.
+
+        Args:
+            requests: The consent requests to create.
+
+        Returns:
+            The created consent requests, in the order given.
+
+        Raises:
+            DuplicateRequestError: If any request duplicates an existing
+                requester+target+scope combination. No request is created.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, request_id: UUID) -> ConsentRequest | None:
         """
@@ -3,6 +3,7 @@
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import BaseModel, model_validator
 
@@ -27,6 +28,26 @@ class ConsentStatus(str, Enum):
 E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
 
 
+@lru_cache(maxsize=512)
+def _contact_value_error(contact_type: ContactType, contact_value: str) -> str | None:
+    """Return why a contact value is invalid for its type, or None if it is valid.
+
+    Cached because the same few contacts are rebuilt on every request that
+    touches them.
+    """
+    if contact_type == ContactType.PHONE:
+        if not E164_PATTERN.match(contact_value):
+            return (
+                f"Phone number must be in E.164 format (e.g., +15551234567), got: {contact_value}"
+            )
+    elif contact_type == ContactType.EMAIL and (
+        "@" not in contact_value or "." not in contact_value
+    ):
+        # Basic email validation
+        return f"Invalid email address: {contact_value}"
+    return None
+
+
 class ContactInfo(BaseModel):
     """
     Immutable value object representing contact information.
@@ -41,17 +62,9 @@ class ContactInfo(BaseModel):
     @model_validator(mode="after")
     def validate_contact_value(self) -> "ContactInfo":
         """Validate contact value matches the contact type."""
-        if self.contact_type == ContactType.PHONE:
-            if not E164_PATTERN.match(self.contact_value):
-                raise ValueError(
-                    f"Phone number must be in E.164 format (e.g., +15551234567), "
-                    f"got: {self.contact_value}"
-                )
-        elif self.contact_type == ContactType.EMAIL and (
-            "@" not in self.contact_value or "." not in self.contact_value
-        ):
-            # Basic email validation
-            raise ValueError(f"Invalid email address: {self.contact_value}")
+        error = _contact_value_error(self.contact_type, self.contact_value)
+        if error:
+            raise ValueError(error)
         return self
 
     def __hash__(self) -> int:
@@ -1,9 +1,9 @@
 """PostgreSQL implementation of the consent repository."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, select, update
+from sqlalchemy import and_, lambda_stmt, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -77,11 +77,25 @@ class PostgresConsentRepository(IConsentRepository):
             ) from e
         return self._model_to_entity(model)
 
+    async def create_many(self, requests: list[ConsentRequest]) -> list[ConsentRequest]:
+        """Create several consent requests with a single batched INSERT."""
+        models = [self._entity_to_model(request) for request in requests]
+        self._session.add_all(models)
+        try:
+            await self._session.flush()
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise DuplicateRequestError(
+                f"Consent request already exists for this requester+target+scope: {e}"
+            ) from e
+        return [self._model_to_entity(model) for model in models]
+
     async def get_by_id(self, request_id: UUID) -> ConsentRequest | None:
         """Get a consent request by ID."""
-        result = await self._session.execute(
-            select(ConsentRequestModel).where(ConsentRequestModel.id == request_id)
+        stmt = lambda_stmt(
+            lambda: select(ConsentRequestModel).where(ConsentRequestModel.id == request_id)
         )
+        result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
 
@@ -92,19 +106,27 @@ class PostgresConsentRepository(IConsentRepository):
         scope: str | None = None,
     ) -> ConsentRequest | None:
         """Get active (granted, unexpired) consent."""
-        now = datetime.utcnow()
-        conditions = [
-            ConsentRequestModel.requester_contact_type == requester.contact_type.value,
-            ConsentRequestModel.requester_contact_value == requester.contact_value,
-            ConsentRequestModel.target_contact_type == target.contact_type.value,
-            ConsentRequestModel.target_contact_value == target.contact_value,
-            ConsentRequestModel.status == ConsentStatus.GRANTED.value,
-            ConsentRequestModel.expires_at > now,
-        ]
+        now = datetime.now(timezone.utc)
+        requester_type = requester.contact_type.value
+        requester_value = requester.contact_value
+        target_type = target.contact_type.value
+        target_value = target.contact_value
+        granted = ConsentStatus.GRANTED.value
+
+        stmt = lambda_stmt(
+            lambda: select(ConsentRequestModel).where(
+                ConsentRequestModel.requester_contact_type == requester_type,
+                ConsentRequestModel.requester_contact_value == requester_value,
+                ConsentRequestModel.target_contact_type == target_type,
+                ConsentRequestModel.target_contact_value == target_value,
+                ConsentRequestModel.status == granted,
+                ConsentRequestModel.expires_at > now,
+            )
+        )
         if scope:
-            conditions.append(ConsentRequestModel.scope == scope)
+            stmt += lambda s: s.where(ConsentRequestModel.scope == scope)
 
-        result = await self._session.execute(select(ConsentRequestModel).where(and_(*conditions)))
+        result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
 
@@ -115,18 +137,23 @@ class PostgresConsentRepository(IConsentRepository):
         scope: str,
     ) -> ConsentRequest | None:
         """Get a pending consent request."""
-        result = await self._session.execute(
-            select(ConsentRequestModel).where(
-                and_(
-                    ConsentRequestModel.requester_contact_type == requester.contact_type.value,
-                    ConsentRequestModel.requester_contact_value == requester.contact_value,
-                    ConsentRequestModel.target_contact_type == target.contact_type.value,
-                    ConsentRequestModel.target_contact_value == target.contact_value,
-                    ConsentRequestModel.scope == scope,
-                    ConsentRequestModel.status == ConsentStatus.PENDING.value,
-                )
+        requester_type = requester.contact_type.value
+        requester_value = requester.contact_value
+        target_type = target.contact_type.value
+        target_value = target.contact_value
+        pending = ConsentStatus.PENDING.value
+
+        stmt = lambda_stmt(
+            lambda: select(ConsentRequestModel).where(
+                ConsentRequestModel.requester_contact_type == requester_type,
+                ConsentRequestModel.requester_contact_value == requester_value,
+                ConsentRequestModel.target_contact_type == target_type,
+                ConsentRequestModel.target_contact_value == target_value,
+                ConsentRequestModel.scope == scope,
+                ConsentRequestModel.status == pending,
             )
         )
+        result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return self._model_to_entity(model) if model else None
 
@@ -136,7 +163,7 @@ class PostgresConsentRepository(IConsentRepository):
         status: ConsentStatus,
     ) -> ConsentRequest:
         """Update the status of a consent request."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         result = await self._session.execute(
             update(ConsentRequestModel)
             .where(ConsentRequestModel.id == request_id)
@@ -160,14 +187,20 @@ class PostgresConsentRepository(IConsentRepository):
         status: ConsentStatus | None = None,
     ) -> list[ConsentRequest]:
         """Find all consent requests for a target."""
-        conditions = [
-            ConsentRequestModel.target_contact_type == target.contact_type.value,
-            ConsentRequestModel.target_contact_value == target.contact_value,
-        ]
+        contact_type = target.contact_type.value
+        contact_value = target.contact_value
+
+        stmt = lambda_stmt(
+            lambda: select(ConsentRequestModel).where(
+                ConsentRequestModel.target_contact_type == contact_type,
+                ConsentRequestModel.target_contact_value == contact_value,
+            )
+        )
         if status:
-            conditions.append(ConsentRequestModel.status == status.value)
+            status_value = status.value
+            stmt += lambda s: s.where(ConsentRequestModel.status == status_value)
 
-        result = await self._session.execute(select(ConsentRequestModel).where(and_(*conditions)))
+        result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [self._model_to_entity(m) for m in models]
 
@@ -177,20 +210,26 @@ class PostgresConsentRepository(IConsentRepository):
         status: ConsentStatus | None = None,
     ) -> list[ConsentRequest]:
         """Find all consent requests from a requester."""
-        conditions = [
-            ConsentRequestModel.requester_contact_type == requester.contact_type.value,
-            ConsentRequestModel.requester_contact_value == requester.contact_value,
-        ]
+        contact_type = requester.contact_type.value
+        contact_value = requester.contact_value
+
+        stmt = lambda_stmt(
+            lambda: select(ConsentRequestModel).where(
+                ConsentRequestModel.requester_contact_type == contact_type,
+                ConsentRequestModel.requester_contact_value == contact_value,
+            )
+        )
         if status:
-            conditions.append(ConsentRequestModel.status == status.value)
+            status_value = status.value
+            stmt += lambda s: s.where(ConsentRequestModel.status == status_value)
 
-        result = await self._session.execute(select(ConsentRequestModel).where(and_(*conditions)))
+        result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [self._model_to_entity(m) for m in models]
 
     async def expire_old_requests(self) -> int:
         """Mark expired requests as EXPIRED status."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         result = await self._session.execute(
             update(ConsentRequestModel)
             .where(
@@ -1,10 +1,12 @@
 """SendGrid email provider implementation."""
 
+import asyncio
 import re
+from typing import NamedTuple
 
 from python_http_client.exceptions import HTTPError
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from sendgrid.helpers.mail import Mail, Personalization, Substitution, To
 
 from consent_mcp.config import settings
 from consent_mcp.domain.providers import (
@@ -17,6 +19,21 @@ from consent_mcp.domain.providers import (
 # Simple email validation pattern
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+# Per-recipient substitution tags for batched sends
+GREETING_TAG = "-greeting-"
+CONSENT_URL_TAG = "-consent_url-"
+
+# SendGrid accepts at most this many personalizations per request
+MAX_PERSONALIZATIONS = 1000
+
+
+class BatchRecipient(NamedTuple):
+    """One recipient of a batched consent request email."""
+
+    email: str
+    name: str | None = None
+    consent_url: str | None = None
+
 
 class SendGridMessageProvider(IMessageProvider):
     """SendGrid email implementation of the message provider."""
@@ -70,6 +87,10 @@ class SendGridMessageProvider(IMessageProvider):
         """Validate email address format."""
         return bool(EMAIL_PATTERN.match(contact_value))
 
+    def _format_greeting(self, target_name: str | None) -> str:
+        """Format the salutation for the target."""
+        return f"Hi {target_name}" if target_name else "Hello"
+
     def _format_subject(self, requester_name: str) -> str:
         """Format the email subject."""
         return f"Consent Request from {requester_name}"
@@ -82,8 +103,18 @@ class SendGridMessageProvider(IMessageProvider):
         consent_url: str | None,
     ) -> str:
         """Format the consent request email body (HTML)."""
-        greeting = f"Hi {target_name}" if target_name else "Hello"
+        return self._render_html_body(
+            self._format_greeting(target_name), requester_name, scope, consent_url
+        )
 
+    def _render_html_body(
+        self,
+        greeting: str,
+        requester_name: str,
+        scope: str,
+        consent_url: str | None,
+    ) -> str:
+        """Render the HTML body around an already formatted greeting."""
         if consent_url:
             action_html = f"""
             <p style="margin-top: 24px; color: #333;">
@@ -154,7 +185,10 @@ class SendGridMessageProvider(IMessageProvider):
         scope: str,
     ) -> str:
         """Format the consent request email body (plain text)."""
-        greeting = f"Hi {target_name}" if target_name else "Hello"
+        return self._render_plain_body(self._format_greeting(target_name), requester_name, scope)
+
+    def _render_plain_body(self, greeting: str, requester_name: str, scope: str) -> str:
+        """Render the plain text body around an already formatted greeting."""
         return (
             f"{greeting},\n\n"
             f"{requester_name} is requesting permission for an AI agent "
@@ -190,7 +224,8 @@ class SendGridMessageProvider(IMessageProvider):
 
         try:
             client = self._get_client()
-            response = client.send(message)
+            # The SendGrid client is blocking; keep it off the event loop
+            response = await asyncio.to_thread(client.send, message)
 
             # Extract message ID from response headers
             message_id = response.headers.get("X-Message-Id", None)
@@ -212,3 +247,97 @@ class SendGridMessageProvider(IMessageProvider):
                 provider=self.provider_name,
                 error=f"Unexpected error: {str(e)}",
             )
+
+    async def send_batch(
+        self,
+        requester_name: str,
+        scope: str,
+        recipients: list[BatchRecipient],
+    ) -> list[MessageDeliveryResult]:
+        """
+        Send one consent request email to many recipients in as few API calls as possible.
+
+        Recipients share the subject and body. Their greeting and consent URL
+        are filled in per recipient through SendGrid substitutions.
+
+        Args:
+            requester_name: Display name of the requester.
+            scope: Description of what consent is for.
+            recipients: Recipients to email.
+
+        Returns:
+            One MessageDeliveryResult per recipient, in the order given.
+        """
+        results: list[MessageDeliveryResult | None] = [None] * len(recipients)
+        # Requests with and without a consent URL need different bodies
+        groups: dict[bool, list[int]] = {True: [], False: []}
+        for i, recipient in enumerate(recipients):
+            if await self.validate_contact(recipient.email):
+                groups[recipient.consent_url is not None].append(i)
+            else:
+                results[i] = MessageDeliveryResult(
+                    success=False,
+                    provider=self.provider_name,
+                    error=f"Invalid email address: {recipient.email}",
+                )
+
+        for has_url, indexes in groups.items():
+            for start in range(0, len(indexes), MAX_PERSONALIZATIONS):
+                chunk = indexes[start : start + MAX_PERSONALIZATIONS]
+                result = await self._send_personalized(
+                    requester_name, scope, [recipients[i] for i in chunk], has_url
+                )
+                for i in chunk:
+                    results[i] = result
+
+        return results
+
+    async def _send_personalized(
+        self,
+        requester_name: str,
+        scope: str,
+        recipients: list[BatchRecipient],
+        has_url: bool,
+    ) -> MessageDeliveryResult:
+        """Send a single API request with one personalization per recipient."""
+        message = Mail(
+            from_email=self._from_email,
+            subject=self._format_subject(requester_name),
+            html_content=self._render_html_body(
+                GREETING_TAG, requester_name, scope, CONSENT_URL_TAG if has_url else None
+            ),
+            plain_text_content=self._render_plain_body(GREETING_TAG, requester_name, scope),
+        )
+        for recipient in recipients:
+            personalization = Personalization()
+            personalization.add_to(To(recipient.email))
+            personalization.add_substitution(
+                Substitution(GREETING_TAG, self._format_greeting(recipient.name))
+            )
+            if has_url:
+                personalization.add_substitution(
+                    Substitution(CONSENT_URL_TAG, recipient.consent_url)
+                )
+            message.add_personalization(personalization)
+
+        try:
+            client = self._get_client()
+            response = await asyncio.to_thread(client.send, message)
+
+            return MessageDeliveryResult(
+                success=True,
+                provider=self.provider_name,
+                message_id=response.headers.get("X-Message-Id", None),
+            )
+        except HTTPError as e:
+            return MessageDeliveryResult(
+                success=False,
+                provider=self.provider_name,
+                error=f"SendGrid error: {e.body}",
+            )
+        except Exception as e:
+            return MessageDeliveryResult(
+                success=False,
+                provider=self.provider_name,
+                error=f"Unexpected error: {str(e)}",
+            )
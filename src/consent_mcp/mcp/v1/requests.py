@@ -5,6 +5,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from consent_mcp.domain.value_objects import ContactType
+
 # E.164 phone pattern
 E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
 
@@ -133,7 +135,7 @@ class AdminSimulateV1Request(BaseModel):
     """V1: Simulate consent response (TEST environment only)."""
 
     target_contact_type: Annotated[
-        str,
+        ContactType,
         Field(description="Type of target contact"),
     ]
     target_contact_value: Annotated[
@@ -149,14 +151,6 @@ class AdminSimulateV1Request(BaseModel):
         Field(description="Simulated response"),
     ]
 
-    @field_validator("target_contact_type")
-    @classmethod
-    def validate_contact_type(cls, v: str) -> str:
-        """Validate contact type."""
-        if v not in ("phone", "email"):
-            raise ValueError("target_contact_type must be 'phone' or 'email'")
-        return v
-
     @field_validator("response")
     @classmethod
     def validate_response(cls, v: str) -> str:
@@ -3,8 +3,10 @@
 import logging
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.types import TextContent, Tool
+from pydantic import TypeAdapter
 
 from consent_mcp.config import settings
 from consent_mcp.domain.auth import IAuthProvider
@@ -27,6 +29,13 @@ from consent_mcp.utils.schema_utils import pydantic_to_input_schema
 
 logger = logging.getLogger(__name__)
 
+# Validators for tool arguments, built once at import
+_ADAPTER_REQUEST_SMS = TypeAdapter(RequestConsentSmsV1Request)
+_ADAPTER_REQUEST_EMAIL = TypeAdapter(RequestConsentEmailV1Request)
+_ADAPTER_CHECK_SMS = TypeAdapter(CheckConsentSmsV1Request)
+_ADAPTER_CHECK_EMAIL = TypeAdapter(CheckConsentEmailV1Request)
+_ADAPTER_ADMIN_SIMULATE = TypeAdapter(AdminSimulateV1Request)
+
 
 class ConsentMcpServer:
     """MCP Server for consent management."""
@@ -136,14 +145,17 @@ class ConsentMcpServer:
                 else:
                     result = {"error": f"Unknown tool: {name}"}
 
-                return [TextContent(type="text", text=str(result))]
+                return [TextContent(type="text", text=orjson.dumps(result).decode())]
             except Exception as e:
-                logger.exception(f"Error in tool {name}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Error in tool %s: %s", name, e, exc_info=settings.include_tracebacks
+                    )
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
 
     async def _request_consent_sms(self, args: dict) -> dict:
         """Handle request_consent_sms tool."""
-        req = RequestConsentSmsV1Request(**args)
+        req = _ADAPTER_REQUEST_SMS.validate_python(args)
 
         requester = ContactInfo(
             contact_type=ContactType.PHONE,
@@ -178,7 +190,7 @@ class ConsentMcpServer:
 
     async def _request_consent_email(self, args: dict) -> dict:
         """Handle request_consent_email tool."""
-        req = RequestConsentEmailV1Request(**args)
+        req = _ADAPTER_REQUEST_EMAIL.validate_python(args)
 
         requester = ContactInfo(
             contact_type=ContactType.EMAIL,
@@ -213,7 +225,7 @@ class ConsentMcpServer:
 
     async def _check_consent_sms(self, args: dict) -> dict:
         """Handle check_consent_sms tool."""
-        req = CheckConsentSmsV1Request(**args)
+        req = _ADAPTER_CHECK_SMS.validate_python(args)
 
         requester = ContactInfo(
             contact_type=ContactType.PHONE,
@@ -231,7 +243,7 @@ class ConsentMcpServer:
 
     async def _check_consent_email(self, args: dict) -> dict:
         """Handle check_consent_email tool."""
-        req = CheckConsentEmailV1Request(**args)
+        req = _ADAPTER_CHECK_EMAIL.validate_python(args)
 
         requester = ContactInfo(
             contact_type=ContactType.EMAIL,
@@ -252,10 +264,10 @@ class ConsentMcpServer:
         if not settings.is_test_env:
             raise PermissionError("Admin tools only available in TEST environment")
 
-        req = AdminSimulateV1Request(**args)
+        req = _ADAPTER_ADMIN_SIMULATE.validate_python(args)
 
         target = ContactInfo(
-            contact_type=ContactType(req.target_contact_type),
+            contact_type=req.target_contact_type,
             contact_value=req.target_contact_value,
         )
 
@@ -4,21 +4,63 @@ These routes handle the two-step consent flow:
 1. GET /v1/consent/{token} - Display consent request details
 2. POST /v1/consent/{token}/grant - Grant consent
 3. POST /v1/consent/{token}/deny - Deny consent
+
+The pages share a stylesheet served from GET /v1/consent/static/consent.css.
 """
 
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response
 
 from consent_mcp.domain.services import ConsentService
 from consent_mcp.domain.value_objects import ConsentStatus
 from consent_mcp.web.templates.consent import (
+    STYLESHEET,
+    STYLESHEET_ETAG,
+    STYLESHEET_LAST_MODIFIED,
+    gzipped_page,
     render_already_responded,
     render_consent_page,
     render_thank_you,
 )
 
+# The stylesheet URL carries a content hash, so it can be cached forever
+_STYLESHEET_HEADERS = {
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "ETag": STYLESHEET_ETAG,
+    "Last-Modified": STYLESHEET_LAST_MODIFIED,
+}
+
+# Tokens are always issued as str(UUID), i.e. the 36-char hyphenated form
+_TOKEN_LENGTH = 36
+
+
+def _parse_token(token: str) -> UUID:
+    """Parse a consent token into a request ID.
+
+    Raises:
+        HTTPException: 400 if the token is not a hyphenated UUID.
+    """
+    if len(token) != _TOKEN_LENGTH:
+        raise HTTPException(status_code=400, detail="Invalid consent token")
+    try:
+        return UUID(hex=token)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid consent token") from e
+
+
+def _static_page_response(request: Request, page: bytes) -> Response:
+    """Serve a static page, using its precompressed body when the client accepts gzip."""
+    body = gzipped_page(page)
+    if body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=body,
+            media_type="text/html",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=page, media_type="text/html", headers={"Vary": "Accept-Encoding"})
+
 
 def create_consent_router(service: ConsentService) -> APIRouter:
     """Create a consent router with the given service.
@@ -31,35 +73,39 @@ def create_consent_router(service: ConsentService) -> APIRouter:
     """
     router = APIRouter(prefix="/v1/consent", tags=["consent"])
 
+    @router.get("/static/consent.css")
+    async def consent_stylesheet(request: Request):
+        """Serve the shared stylesheet for consent pages."""
+        if request.headers.get("if-none-match") == STYLESHEET_ETAG:
+            return Response(status_code=304, headers=_STYLESHEET_HEADERS)
+        return Response(content=STYLESHEET, media_type="text/css", headers=_STYLESHEET_HEADERS)
+
     @router.get("/{token}", response_class=HTMLResponse)
-    async def show_consent_page(token: str):
+    async def show_consent_page(request: Request, token: str):
         """Display the consent confirmation page."""
-        try:
-            request_id = UUID(token)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail="Invalid consent token") from e
+        request_id = _parse_token(token)
 
         consent_request = await service.get_request_by_id(request_id)
         if not consent_request:
             raise HTTPException(status_code=404, detail="Consent request not found")
 
         if consent_request.status != ConsentStatus.PENDING:
-            return render_already_responded(consent_request.status)
-
-        return render_consent_page(
-            token=token,
-            requester_name=consent_request.requester.name or "Someone",
-            scope=consent_request.scope,
-            target_name=consent_request.target.name,
+            return _static_page_response(request, render_already_responded(consent_request.status))
+
+        return Response(
+            content=render_consent_page(
+                token=token,
+                requester_name=consent_request.requester.name or "Someone",
+                scope=consent_request.scope,
+                target_name=consent_request.target.name,
+            ),
+            media_type="text/html",
         )
 
     @router.post("/{token}/grant", response_class=HTMLResponse)
-    async def grant_consent(token: str):
+    async def grant_consent(request: Request, token: str):
         """Grant consent for the request."""
-        try:
-            request_id = UUID(token)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail="Invalid consent token") from e
+        request_id = _parse_token(token)
 
         # Use service to grant consent
         result = await service.grant_consent(request_id)
@@ -68,17 +114,14 @@ def create_consent_router(service: ConsentService) -> APIRouter:
             if result.new_status is None:
                 raise HTTPException(status_code=404, detail="Consent request not found")
             # Already responded
-            return render_already_responded(result.new_status)
+            return _static_page_response(request, render_already_responded(result.new_status))
 
-        return render_thank_you(granted=True)
+        return _static_page_response(request, render_thank_you(granted=True))
 
     @router.post("/{token}/deny", response_class=HTMLResponse)
-    async def deny_consent(token: str):
+    async def deny_consent(request: Request, token: str):
         """Deny consent for the request."""
-        try:
-            request_id = UUID(token)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail="Invalid consent token") from e
+        request_id = _parse_token(token)
 
         # Use service to deny consent
         result = await service.deny_consent(request_id)
@@ -87,8 +130,8 @@ def create_consent_router(service: ConsentService) -> APIRouter:
             if result.new_status is None:
                 raise HTTPException(status_code=404, detail="Consent request not found")
             # Already responded
-            return render_already_responded(result.new_status)
+            return _static_page_response(request, render_already_responded(result.new_status))
 
-        return render_thank_you(granted=False)
+        return _static_page_response(request, render_thank_you(granted=False))
 
     return router
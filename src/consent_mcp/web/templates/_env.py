@@ -0,0 +1,17 @@
+"""Jinja2 environment for consent page templates."""
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
+
+# Templates ship inside the package and never change at runtime, so
+# auto-reload is disabled and compiled bytecode is cached on disk
+env = Environment(
+    loader=PackageLoader("consent_mcp.web", "templates"),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
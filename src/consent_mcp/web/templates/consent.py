@@ -1,6 +1,45 @@
 """HTML templates for consent pages."""
 
+import gzip
+import hashlib
+import re
+from email.utils import formatdate
+from functools import lru_cache
+from html import escape
+from importlib.resources import files
+
 from consent_mcp.domain.value_objects import ConsentStatus
+from consent_mcp.web.templates._env import env
+
+# Shared stylesheet, served separately so browsers can cache it
+STYLESHEET = files(__package__).joinpath("consent.css").read_bytes()
+_STYLESHEET_DIGEST = hashlib.sha256(STYLESHEET).hexdigest()
+STYLESHEET_ETAG = f'W/"{_STYLESHEET_DIGEST}"'
+STYLESHEET_LAST_MODIFIED = formatdate(usegmt=True)
+STYLESHEET_URL = f"/v1/consent/static/consent.css?v={_STYLESHEET_DIGEST[:16]}"
+
+env.globals["stylesheet_url"] = STYLESHEET_URL
+
+_TEMPLATES = {
+    name: env.get_template(f"{name}.html") for name in ("consent", "thank_you", "already_responded")
+}
+
+
+# The consent page is the only per-request render. Its template is rendered
+# once with marker values and split into constant byte fragments, so each
+# request only escapes and joins the few values that vary.
+_FIELD_MARKER = re.compile(r"\x00(\w+)\x00")
+_consent_split = _FIELD_MARKER.split(
+    _TEMPLATES["consent"].render(
+        **{field: f"\x00{field}\x00" for field in ("token", "greeting", "requester_name", "scope")}
+    )
+)
+_CONSENT_HEAD = _consent_split[0].encode()
+_CONSENT_SEGMENTS: tuple[tuple[str, bytes], ...] = tuple(
+    (field, part.encode())
+    for field, part in zip(_consent_split[1::2], _consent_split[2::2], strict=True)
+)
+_GREETING_DEFAULT = b"Hello"
 
 
 def render_consent_page(
@@ -8,131 +47,24 @@ def render_consent_page(
     requester_name: str,
     scope: str,
     target_name: str | None = None,
-) -> str:
-    """Render the consent confirmation page."""
-    greeting = f"Hi {target_name}" if target_name else "Hello"
-
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Consent Request</title>
-        <style>
-            * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }}
-            .card {{
-                background: white;
-                border-radius: 16px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                max-width: 480px;
-                width: 100%;
-                padding: 40px;
-            }}
-            h1 {{
-                color: #333;
-                font-size: 24px;
-                margin-bottom: 20px;
-            }}
-            .greeting {{
-                color: #666;
-                font-size: 16px;
-                margin-bottom: 24px;
-            }}
-            .scope-box {{
-                background: #f8f9fa;
-                border-left: 4px solid #667eea;
-                padding: 16px;
-                border-radius: 0 8px 8px 0;
-                margin: 24px 0;
-            }}
-            .scope-label {{
-                font-size: 12px;
-                color: #999;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }}
-            .scope-text {{
-                font-size: 18px;
-                color: #333;
-                margin-top: 8px;
-            }}
-            .buttons {{
-                display: flex;
-                gap: 12px;
-                margin-top: 32px;
-            }}
-            button {{
-                flex: 1;
-                padding: 14px 24px;
-                border: none;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: transform 0.2s, box-shadow 0.2s;
-            }}
-            button:hover {{
-                transform: translateY(-2px);
-            }}
-            .grant {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-            }}
-            .deny {{
-                background: #f1f3f4;
-                color: #666;
-            }}
-            .notice {{
-                margin-top: 24px;
-                font-size: 12px;
-                color: #999;
-                text-align: center;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="card">
-            <h1>🔐 Consent Request</h1>
-            <p class="greeting">{greeting},</p>
-            <p><strong>{requester_name}</strong> is requesting your permission for an AI agent to contact you.</p>
-
-            <div class="scope-box">
-                <div class="scope-label">Purpose</div>
-                <div class="scope-text">{scope}</div>
-            </div>
-
-            <p>By clicking <strong>Grant Consent</strong>, you authorize this request.</p>
-
-            <div class="buttons">
-                <form action="/v1/consent/{token}/grant" method="post" style="flex: 1;">
-                    <button type="submit" class="grant" style="width: 100%;">Grant Consent</button>
-                </form>
-                <form action="/v1/consent/{token}/deny" method="post" style="flex: 1;">
-                    <button type="submit" class="deny" style="width: 100%;">Decline</button>
-                </form>
-            </div>
-
-            <p class="notice">
-                This is a one-time consent request. You can revoke consent at any time.
-            </p>
-        </div>
-    </body>
-    </html>
-    """
-
-
-def render_thank_you(granted: bool) -> str:
+) -> bytes:
+    """Render the consent confirmation page as UTF-8 bytes."""
+    values = {
+        # Token has already been validated as a UUID by the route
+        "token": token.encode("ascii"),
+        "greeting": escape(f"Hi {target_name}").encode() if target_name else _GREETING_DEFAULT,
+        "requester_name": escape(requester_name).encode(),
+        "scope": escape(scope).encode(),
+    }
+
+    pieces = [_CONSENT_HEAD]
+    for field, part in _CONSENT_SEGMENTS:
+        pieces.append(values[field])
+        pieces.append(part)
+    return b"".join(pieces)
+
+
+def _render_thank_you_impl(granted: bool) -> bytes:
     """Render the thank you page after response."""
     if granted:
         icon = "✅"
@@ -145,108 +77,39 @@ def render_thank_you(granted: bool) -> str:
         message = "You have declined this consent request."
         color = "#ef4444"
 
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{title}</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }}
-            .card {{
-                background: white;
-                border-radius: 16px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                max-width: 400px;
-                width: 100%;
-                padding: 40px;
-                text-align: center;
-            }}
-            .icon {{
-                font-size: 64px;
-                margin-bottom: 20px;
-            }}
-            h1 {{
-                color: {color};
-                font-size: 24px;
-                margin-bottom: 16px;
-            }}
-            p {{
-                color: #666;
-                font-size: 16px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="card">
-            <div class="icon">{icon}</div>
-            <h1>{title}</h1>
-            <p>{message}</p>
-        </div>
-    </body>
-    </html>
-    """
-
-
-def render_already_responded(status: ConsentStatus) -> str:
-    """Render page for already-responded requests."""
-    status_text = status.value.title()
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Already Responded</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }}
-            .card {{
-                background: white;
-                border-radius: 16px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                max-width: 400px;
-                width: 100%;
-                padding: 40px;
-                text-align: center;
-            }}
-            .icon {{
-                font-size: 64px;
-                margin-bottom: 20px;
-            }}
-            h1 {{
-                color: #666;
-                font-size: 24px;
-                margin-bottom: 16px;
-            }}
-            p {{
-                color: #999;
-                font-size: 16px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="card">
-            <div class="icon">ℹ️</div>
-            <h1>Already Responded</h1>
-            <p>This consent request has already been {status_text.lower()}.</p>
-        </div>
-    </body>
-    </html>
-    """
+    page = _TEMPLATES["thank_you"].render(
+        icon=icon,
+        title=title,
+        message=message,
+        color=color,
+    )
+    return page.encode()
+
+
+def render_thank_you(granted: bool) -> bytes:
+    """Return the prerendered thank you page after response."""
+    return _THANK_YOU[granted]
+
+
+@lru_cache(maxsize=8)
+def render_already_responded(status: ConsentStatus) -> bytes:
+    """Render page for already-responded requests as UTF-8 bytes."""
+    return _TEMPLATES["already_responded"].render(status_text=status.value).encode()
+
+
+# Both thank you variants are fully determined at import time
+_THANK_YOU = {
+    True: _render_thank_you_impl(True),
+    False: _render_thank_you_impl(False),
+}
+
+# Static pages are fixed at import, so their gzip encodings are too
+_GZIPPED_PAGES = {
+    page: gzip.compress(page, compresslevel=9, mtime=0)
+    for page in (*_THANK_YOU.values(), *map(render_already_responded, ConsentStatus))
+}
+
+
+def gzipped_page(page: bytes) -> bytes | None:
+    """Return the precompressed gzip body for a static page, if there is one."""
+    return _GZIPPED_PAGES.get(page)
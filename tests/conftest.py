@@ -1,36 +1,46 @@
 """Test configuration and fixtures."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from consent_mcp.config import Settings
-from consent_mcp.domain.auth import AuthContext, IAuthProvider
-from consent_mcp.domain.providers import IMessageProvider, MessageDeliveryResult, ProviderType
+from consent_mcp.domain.auth import IAuthProvider
+from consent_mcp.domain.entities import ConsentRequest
+from consent_mcp.domain.providers import ProviderType
+from consent_mcp.domain.repository import IConsentRepository
 from consent_mcp.domain.services import ConsentService
 from consent_mcp.domain.value_objects import ContactInfo, ContactType
-from consent_mcp.infrastructure.database.models import Base
+from consent_mcp.infrastructure.database.models import Base, ConsentRequestModel
 from consent_mcp.infrastructure.database.repository import PostgresConsentRepository
+from tests.support.fakes import InMemoryConsentRepository
+from tests.support.stubs import StubAuthProvider, StubMessageProvider
+
+try:
+    import uvloop
+except ImportError:  # Windows, or dev extras not installed
+    uvloop = None
 
 
 # ============================================
-# Event loop fixture
+# Event loop
 # ============================================
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(config, item):  # noqa: ARG001
+    """Run async tests and fixtures on uvloop when it is available."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
 
 
 # ============================================
 # Test settings
 # ============================================
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings."""
     return Settings(
@@ -44,16 +54,31 @@ def test_settings() -> Settings:
 # ============================================
 # Database fixtures
 # ============================================
-@pytest.fixture
-async def async_engine(test_settings):
-    """Create async engine for tests."""
+@pytest.fixture(scope="session")
+def db_schema(request) -> str | None:
+    """Name of this pytest-xdist worker's private schema, or None outside xdist."""
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid")
+    return f"test_{worker_id}" if worker_id else None
+
+
+@pytest.fixture(scope="session")
+async def async_engine(test_settings, db_schema):
+    """Create async engine and schema once per test session."""
+    # Under xdist each worker gets its own schema so parallel creates don't collide
+    connect_args = {"server_settings": {"search_path": db_schema}} if db_schema else {}
+
+    # Tests share the session event loop, so pooled connections can be reused
     engine = create_async_engine(
         test_settings.database_url,
         echo=False,
+        poolclass=AsyncAdaptedQueuePool,
+        connect_args=connect_args,
     )
 
     # Create tables
     async with engine.begin() as conn:
+        if db_schema:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{db_schema}"'))
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
@@ -61,83 +86,118 @@ async def async_engine(test_settings):
     # Drop tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if db_schema:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{db_schema}" CASCADE'))
 
     await engine.dispose()
 
 
+@pytest.fixture(scope="session")
+async def db_connection(async_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection per session inside a transaction that is never committed."""
+    async with async_engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
 @pytest.fixture
-async def async_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create async session for tests."""
-    session_factory = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
+async def async_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create async session inside a SAVEPOINT rolled back after each test."""
+    savepoint = await db_connection.begin_nested()
+    # Session commits/rollbacks only touch a nested SAVEPOINT inside the test's one
+    session = AsyncSession(
+        bind=db_connection,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-
-    async with session_factory() as session:
+    try:
         yield session
-        await session.rollback()
+    finally:
+        await session.close()
+        if savepoint.is_active:
+            await savepoint.rollback()
 
 
-@pytest.fixture
-async def repository(async_session) -> PostgresConsentRepository:
-    """Create repository for tests."""
-    return PostgresConsentRepository(async_session)
+@pytest.fixture(scope="session")
+def seeded_request(frozen_now) -> ConsentRequest:
+    """Read-only request present in every repository under test.
+
+    Its contacts are distinct from the sample_* fixtures so tests that
+    assert on those contacts never see it.
+    """
+    return ConsentRequest(
+        requester=ContactInfo(
+            contact_type=ContactType.PHONE,
+            contact_value="+15550000001",
+            name="Seeded Requester",
+        ),
+        target=ContactInfo(
+            contact_type=ContactType.PHONE,
+            contact_value="+15550000002",
+            name="Seeded Target",
+        ),
+        scope="wellness_check",
+        expires_at=frozen_now + timedelta(days=30),
+    )
+
+
+@pytest.fixture(scope="session")
+async def postgres_seed(db_connection, seeded_request) -> None:
+    """Insert seeded_request once per session, outside any per-test SAVEPOINT."""
+    await db_connection.execute(
+        insert(ConsentRequestModel),
+        [
+            {
+                "id": seeded_request.id,
+                "requester_contact_type": seeded_request.requester.contact_type.value,
+                "requester_contact_value": seeded_request.requester.contact_value,
+                "requester_name": seeded_request.requester.name,
+                "target_contact_type": seeded_request.target.contact_type.value,
+                "target_contact_value": seeded_request.target.contact_value,
+                "target_name": seeded_request.target.name,
+                "scope": seeded_request.scope,
+                "status": seeded_request.status.value,
+                "expires_at": seeded_request.expires_at,
+                "created_at": seeded_request.created_at,
+                "updated_at": seeded_request.updated_at,
+            }
+        ],
+    )
+
+
+@pytest.fixture(
+    params=["inmemory", pytest.param("postgres", marks=pytest.mark.integration)],
+)
+def repository(request, seeded_request) -> IConsentRepository:
+    """Create repository for tests: an in-memory fake, and Postgres for integration runs."""
+    if request.param == "inmemory":
+        return InMemoryConsentRepository((seeded_request,))
+    request.getfixturevalue("postgres_seed")
+    return PostgresConsentRepository(request.getfixturevalue("async_session"))
 
 
 # ============================================
 # Mock providers
 # ============================================
 @pytest.fixture
-def mock_sms_provider() -> IMessageProvider:
-    """Create mock SMS provider."""
-    provider = MagicMock(spec=IMessageProvider)
-    provider.provider_type = ProviderType.SMS
-    provider.provider_name = "mock_sms"
-    provider.is_configured.return_value = True
-    provider.validate_contact = AsyncMock(return_value=True)
-    provider.send_consent_request = AsyncMock(
-        return_value=MessageDeliveryResult(
-            success=True,
-            provider="mock_sms",
-            message_id="mock_msg_123",
-        )
-    )
-    return provider
+def mock_sms_provider() -> StubMessageProvider:
+    """Create stub SMS provider."""
+    return StubMessageProvider(ProviderType.SMS, "mock_sms", "mock_msg_123")
 
 
 @pytest.fixture
-def mock_email_provider() -> IMessageProvider:
-    """Create mock email provider."""
-    provider = MagicMock(spec=IMessageProvider)
-    provider.provider_type = ProviderType.EMAIL
-    provider.provider_name = "mock_email"
-    provider.is_configured.return_value = True
-    provider.validate_contact = AsyncMock(return_value=True)
-    provider.send_consent_request = AsyncMock(
-        return_value=MessageDeliveryResult(
-            success=True,
-            provider="mock_email",
-            message_id="mock_email_123",
-        )
-    )
-    return provider
+def mock_email_provider() -> StubMessageProvider:
+    """Create stub email provider."""
+    return StubMessageProvider(ProviderType.EMAIL, "mock_email", "mock_email_123")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_auth_provider() -> IAuthProvider:
-    """Create mock auth provider."""
-    provider = MagicMock(spec=IAuthProvider)
-    provider.provider_name = "mock_auth"
-    provider.extract_credentials.return_value = {"api_key": "test_key"}
-    provider.authenticate = AsyncMock(
-        return_value=AuthContext(
-            client_id="test_client",
-            client_name="Test Client",
-            scopes=["*"],
-        )
-    )
-    return provider
+    """Create stub auth provider."""
+    return StubAuthProvider()
 
 
 # ============================================
@@ -156,7 +216,13 @@ async def consent_service(repository, mock_sms_provider, mock_email_provider) ->
 # ============================================
 # Sample data fixtures
 # ============================================
-@pytest.fixture
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """Reference time pinned once per test session."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
 def sample_phone_requester() -> ContactInfo:
     """Sample phone requester."""
     return ContactInfo(
@@ -166,7 +232,7 @@ def sample_phone_requester() -> ContactInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_phone_target() -> ContactInfo:
     """Sample phone target."""
     return ContactInfo(
@@ -176,7 +242,7 @@ def sample_phone_target() -> ContactInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_email_requester() -> ContactInfo:
     """Sample email requester."""
     return ContactInfo(
@@ -186,7 +252,7 @@ def sample_email_requester() -> ContactInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_email_target() -> ContactInfo:
     """Sample email target."""
     return ContactInfo(
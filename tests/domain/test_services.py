@@ -1,12 +1,9 @@
 """Tests for ConsentService domain service."""
 
-import pytest
-
 
 class TestConsentServiceRequestConsent:
     """Tests for ConsentService.request_consent method."""
 
-    @pytest.mark.asyncio
     async def test_request_consent_sms_creates_pending_request(
         self, consent_service, sample_phone_requester, sample_phone_target, mock_sms_provider
     ):
@@ -23,9 +20,8 @@ class TestConsentServiceRequestConsent:
         assert "expires_at" in result
 
         # Verify SMS was sent
-        mock_sms_provider.send_consent_request.assert_called_once()
+        assert mock_sms_provider.send_consent_request_called_once
 
-    @pytest.mark.asyncio
     async def test_request_consent_email_creates_pending_request(
         self, consent_service, sample_email_requester, sample_email_target, mock_email_provider
     ):
@@ -41,9 +37,8 @@ class TestConsentServiceRequestConsent:
         assert result["request_id"] is not None
 
         # Verify email was sent
-        mock_email_provider.send_consent_request.assert_called_once()
+        assert mock_email_provider.send_consent_request_called_once
 
-    @pytest.mark.asyncio
     async def test_request_consent_returns_existing_if_already_pending(
         self, consent_service, sample_phone_requester, sample_phone_target
     ):
@@ -72,7 +67,6 @@ class TestConsentServiceRequestConsent:
 class TestConsentServiceCheckConsent:
     """Tests for ConsentService.check_consent method."""
 
-    @pytest.mark.asyncio
     async def test_check_consent_returns_false_for_pending(
         self, consent_service, sample_phone_requester, sample_phone_target
     ):
@@ -91,7 +85,6 @@ class TestConsentServiceCheckConsent:
 
         assert has_consent is False
 
-    @pytest.mark.asyncio
     async def test_check_consent_returns_false_when_no_request(
         self, consent_service, sample_phone_requester, sample_phone_target
     ):
@@ -107,7 +100,6 @@ class TestConsentServiceCheckConsent:
 class TestConsentServiceSimulateResponse:
     """Tests for ConsentService.simulate_response method."""
 
-    @pytest.mark.asyncio
     async def test_simulate_response_grants_consent(
         self, consent_service, sample_phone_requester, sample_phone_target
     ):
@@ -137,7 +129,6 @@ class TestConsentServiceSimulateResponse:
         )
         assert has_consent is True
 
-    @pytest.mark.asyncio
     async def test_simulate_response_declines_consent(
         self, consent_service, sample_phone_requester, sample_phone_target
     ):
@@ -167,7 +158,6 @@ class TestConsentServiceSimulateResponse:
         )
         assert has_consent is False
 
-    @pytest.mark.asyncio
     async def test_simulate_response_fails_without_pending_request(
         self, consent_service, sample_phone_target
     ):
@@ -0,0 +1,77 @@
+"""Infrastructure test fixtures."""
+
+from collections.abc import Callable
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from twilio.rest import Client
+
+from consent_mcp.domain.entities import ConsentRequest
+from consent_mcp.domain.value_objects import ConsentStatus
+from consent_mcp.infrastructure.providers.sendgrid import SendGridMessageProvider
+from consent_mcp.infrastructure.providers.twilio import TwilioMessageProvider
+
+
+# ============================================
+# SendGrid providers
+# ============================================
+@pytest.fixture(scope="session")
+def sg_provider_unconfigured() -> SendGridMessageProvider:
+    """SendGrid provider built from default settings."""
+    return SendGridMessageProvider()
+
+
+@pytest.fixture(scope="session")
+def sg_provider_configured() -> SendGridMessageProvider:
+    """SendGrid provider with test credentials; never used to reach the client."""
+    return SendGridMessageProvider(
+        api_key="test_key",
+        from_email="noreply@example.com",
+    )
+
+
+# ============================================
+# Twilio providers
+# ============================================
+@pytest.fixture(scope="session")
+def twilio_provider_unconfigured() -> TwilioMessageProvider:
+    """Twilio provider built from default settings."""
+    return TwilioMessageProvider()
+
+
+@pytest.fixture(scope="session")
+def twilio_client_factory() -> Callable[[], MagicMock]:
+    """Build fresh autospec Twilio clients whose sends return SM123456."""
+
+    def _make() -> MagicMock:
+        client = create_autospec(Client, instance=True)
+        client.messages.create.return_value = SimpleNamespace(sid="SM123456")
+        return client
+
+    return _make
+
+
+# ============================================
+# Consent request factory
+# ============================================
+@pytest.fixture
+def make_request(
+    sample_phone_requester, sample_phone_target, frozen_now
+) -> Callable[..., ConsentRequest]:
+    """Build phone consent requests for the sample requester and target."""
+
+    def _make(
+        status: ConsentStatus = ConsentStatus.PENDING,
+        expires_in: timedelta = timedelta(days=30),
+    ) -> ConsentRequest:
+        return ConsentRequest(
+            requester=sample_phone_requester,
+            target=sample_phone_target,
+            scope="wellness_check",
+            status=status,
+            expires_at=frozen_now + expires_in,
+        )
+
+    return _make
@@ -1,11 +1,10 @@
 """Tests for PostgresConsentRepository."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
 
-from consent_mcp.domain.entities import ConsentRequest
 from consent_mcp.domain.repository import DuplicateRequestError, RequestNotFoundError
 from consent_mcp.domain.value_objects import ConsentStatus
 
@@ -13,71 +12,48 @@ from consent_mcp.domain.value_objects import ConsentStatus
 class TestRepositoryCreate:
     """Tests for PostgresConsentRepository.create method."""
 
-    @pytest.mark.asyncio
-    async def test_create_saves_consent_request(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_create_saves_consent_request(self, repository, make_request):
         """Test that create() saves a consent request."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
+        request = make_request()
 
         saved = await repository.create(request)
 
         assert saved.id == request.id
         assert saved.status == ConsentStatus.PENDING
 
-    @pytest.mark.asyncio
-    async def test_create_raises_on_duplicate(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_create_raises_on_duplicate(self, repository, make_request):
         """Test that create() raises DuplicateRequestError for duplicates."""
-        request1 = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request1)
+        await repository.create_many([make_request()])
 
-        # Try to create duplicate
-        request2 = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",  # Same scope
-            expires_at=datetime.utcnow() + timedelta(days=60),
-        )
+        # Try to create duplicate with the same scope
+        request2 = make_request(expires_in=timedelta(days=60))
 
         with pytest.raises(DuplicateRequestError):
             await repository.create(request2)
 
+    async def test_create_many_saves_all_requests(self, repository, make_request):
+        """Test that create_many() saves every request in one batch."""
+        requests = [make_request(), make_request()]
+        requests[1] = requests[1].model_copy(update={"scope": "appointment_reminder"})
+
+        saved = await repository.create_many(requests)
+
+        assert [r.id for r in saved] == [r.id for r in requests]
+        for request in requests:
+            assert await repository.get_by_id(request.id) is not None
+
 
 class TestRepositoryGetById:
     """Tests for PostgresConsentRepository.get_by_id method."""
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_returns_request(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_get_by_id_returns_request(self, repository, seeded_request):
         """Test that get_by_id() returns the correct request."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request)
-
-        retrieved = await repository.get_by_id(request.id)
+        retrieved = await repository.get_by_id(seeded_request.id)
 
         assert retrieved is not None
-        assert retrieved.id == request.id
-        assert retrieved.scope == request.scope
+        assert retrieved.id == seeded_request.id
+        assert retrieved.scope == seeded_request.scope
 
-    @pytest.mark.asyncio
     async def test_get_by_id_returns_none_for_missing(self, repository):
         """Test that get_by_id() returns None for missing ID."""
         retrieved = await repository.get_by_id(uuid4())
@@ -87,18 +63,11 @@ class TestRepositoryGetById:
 class TestRepositoryGetActiveConsent:
     """Tests for PostgresConsentRepository.get_active_consent method."""
 
-    @pytest.mark.asyncio
     async def test_get_active_consent_returns_granted_unexpired(
-        self, repository, sample_phone_requester, sample_phone_target
+        self, repository, make_request, sample_phone_requester, sample_phone_target
     ):
         """Test get_active_consent returns granted, unexpired consent."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            status=ConsentStatus.GRANTED,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
+        request = make_request(status=ConsentStatus.GRANTED)
         await repository.create(request)
 
         active = await repository.get_active_consent(
@@ -109,61 +78,26 @@ class TestRepositoryGetActiveConsent:
         assert active is not None
         assert active.id == request.id
 
-    @pytest.mark.asyncio
-    async def test_get_active_consent_ignores_pending(
-        self, repository, sample_phone_requester, sample_phone_target
+    @pytest.mark.parametrize(
+        ("status", "expires_in"),
+        [
+            (ConsentStatus.PENDING, timedelta(days=30)),
+            (ConsentStatus.GRANTED, timedelta(days=-1)),
+            (ConsentStatus.REVOKED, timedelta(days=30)),
+        ],
+        ids=["pending", "expired", "revoked"],
+    )
+    async def test_get_active_consent_ignores_inactive(
+        self,
+        repository,
+        make_request,
+        sample_phone_requester,
+        sample_phone_target,
+        status,
+        expires_in,
     ):
-        """Test get_active_consent ignores pending requests."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            status=ConsentStatus.PENDING,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request)
-
-        active = await repository.get_active_consent(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-        )
-
-        assert active is None
-
-    @pytest.mark.asyncio
-    async def test_get_active_consent_ignores_expired(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
-        """Test get_active_consent ignores expired requests."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            status=ConsentStatus.GRANTED,
-            expires_at=datetime.now(timezone.utc) - timedelta(days=1),  # Expired
-        )
-        await repository.create(request)
-
-        active = await repository.get_active_consent(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-        )
-
-        assert active is None
-
-    @pytest.mark.asyncio
-    async def test_get_active_consent_ignores_revoked(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
-        """Test get_active_consent ignores revoked requests."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            status=ConsentStatus.REVOKED,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request)
+        """Test get_active_consent ignores pending, expired and revoked requests."""
+        await repository.create(make_request(status=status, expires_in=expires_in))
 
         active = await repository.get_active_consent(
             requester=sample_phone_requester,
@@ -176,17 +110,9 @@ class TestRepositoryGetActiveConsent:
 class TestRepositoryUpdateStatus:
     """Tests for PostgresConsentRepository.update_status method."""
 
-    @pytest.mark.asyncio
-    async def test_update_status_updates_request(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_update_status_updates_request(self, repository, make_request):
         """Test update_status updates the request status."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
+        request = make_request()
         await repository.create(request)
 
         updated = await repository.update_status(request.id, ConsentStatus.GRANTED)
@@ -194,7 +120,6 @@ class TestRepositoryUpdateStatus:
         assert updated.status == ConsentStatus.GRANTED
         assert updated.responded_at is not None
 
-    @pytest.mark.asyncio
     async def test_update_status_raises_for_missing(self, repository):
         """Test update_status raises for missing request."""
         with pytest.raises(RequestNotFoundError):
@@ -204,54 +129,33 @@ class TestRepositoryUpdateStatus:
 class TestRepositoryFindMethods:
     """Tests for PostgresConsentRepository.find_by_* methods."""
 
-    @pytest.mark.asyncio
-    async def test_find_by_target_returns_matching_requests(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_find_by_target_returns_matching_requests(self, repository, seeded_request):
         """Test find_by_target returns all requests for a target."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request)
-
-        results = await repository.find_by_target(sample_phone_target)
+        results = await repository.find_by_target(seeded_request.target)
 
         assert len(results) == 1
-        assert results[0].id == request.id
+        assert results[0].id == seeded_request.id
 
-    @pytest.mark.asyncio
-    async def test_find_by_requester_returns_matching_requests(
-        self, repository, sample_phone_requester, sample_phone_target
-    ):
+    async def test_find_by_requester_returns_matching_requests(self, repository, seeded_request):
         """Test find_by_requester returns all requests from a requester."""
-        request = ConsentRequest(
-            requester=sample_phone_requester,
-            target=sample_phone_target,
-            scope="wellness_check",
-            expires_at=datetime.now(timezone.utc) + timedelta(days=30),
-        )
-        await repository.create(request)
-
-        results = await repository.find_by_requester(sample_phone_requester)
+        results = await repository.find_by_requester(seeded_request.requester)
 
         assert len(results) == 1
-        assert results[0].id == request.id
-
-    @pytest.mark.asyncio
-    async def test_find_by_target_returns_empty_for_no_matches(
-        self, repository, sample_phone_target
+        assert results[0].id == seeded_request.id
+
+    @pytest.mark.parametrize(
+        ("method", "contact_fixture"),
+        [
+            ("find_by_target", "sample_phone_target"),
+            ("find_by_requester", "sample_phone_requester"),
+        ],
+    )
+    async def test_find_returns_empty_for_no_matches(
+        self, request, repository, method, contact_fixture
     ):
-        """Test find_by_target returns empty list when no matches."""
-        results = await repository.find_by_target(sample_phone_target)
-        assert results == []
+        """Test find_by_target/find_by_requester return an empty list when no matches."""
+        contact = request.getfixturevalue(contact_fixture)
+
+        results = await getattr(repository, method)(contact)
 
-    @pytest.mark.asyncio
-    async def test_find_by_requester_returns_empty_for_no_matches(
-        self, repository, sample_phone_requester
-    ):
-        """Test find_by_requester returns empty list when no matches."""
-        results = await repository.find_by_requester(sample_phone_requester)
         assert results == []
@@ -1,36 +1,48 @@
 """Tests for SendGridMessageProvider."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from consent_mcp.domain.providers import ProviderType
-from consent_mcp.infrastructure.providers.sendgrid import SendGridMessageProvider
+from consent_mcp.infrastructure.providers.sendgrid import BatchRecipient, SendGridMessageProvider
+from tests.support.stubs import StubSendGridClient
+
+
+@pytest.fixture(scope="module")
+def html_body(sg_provider_unconfigured) -> str:
+    """HTML body rendered once for the formatting assertions."""
+    return sg_provider_unconfigured._format_html_body(
+        requester_name="Alice",
+        target_name="Bob",
+        scope="wellness_check",
+        consent_url=None,
+    )
+
+
+@pytest.fixture
+def sendgrid_client(monkeypatch) -> StubSendGridClient:
+    """Make SendGridAPIClient hand out a recording stub client."""
+    client = StubSendGridClient()
+    monkeypatch.setattr(
+        "consent_mcp.infrastructure.providers.sendgrid.SendGridAPIClient",
+        lambda api_key: client,  # noqa: ARG005
+    )
+    return client
 
 
 class TestSendGridProviderConfiguration:
     """Tests for SendGridMessageProvider configuration."""
 
-    def test_provider_type_is_email(self):
+    def test_provider_type_is_email(self, sg_provider_configured):
         """Test that provider type is EMAIL."""
-        provider = SendGridMessageProvider(
-            api_key="test_key",
-            from_email="noreply@example.com",
-        )
-        assert provider.provider_type == ProviderType.EMAIL
+        assert sg_provider_configured.provider_type == ProviderType.EMAIL
 
-    def test_provider_name_is_sendgrid(self):
+    def test_provider_name_is_sendgrid(self, sg_provider_unconfigured):
         """Test that provider name is sendgrid."""
-        provider = SendGridMessageProvider()
-        assert provider.provider_name == "sendgrid"
+        assert sg_provider_unconfigured.provider_name == "sendgrid"
 
-    def test_is_configured_returns_true_when_all_set(self):
+    def test_is_configured_returns_true_when_all_set(self, sg_provider_configured):
         """Test is_configured returns True when all credentials set."""
-        provider = SendGridMessageProvider(
-            api_key="test_key",
-            from_email="noreply@example.com",
-        )
-        assert provider.is_configured() is True
+        assert sg_provider_configured.is_configured() is True
 
     def test_is_configured_returns_false_when_api_key_missing(self):
         """Test is_configured returns False when api_key missing."""
@@ -52,49 +64,28 @@ class TestSendGridProviderConfiguration:
 class TestSendGridContactValidation:
     """Tests for SendGridMessageProvider.validate_contact method."""
 
-    @pytest.mark.asyncio
-    async def test_validate_contact_valid_email(self):
-        """Test validate_contact accepts valid email."""
-        provider = SendGridMessageProvider()
-        assert await provider.validate_contact("user@example.com") is True
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_valid_with_subdomain(self):
-        """Test validate_contact accepts email with subdomain."""
-        provider = SendGridMessageProvider()
-        assert await provider.validate_contact("test.user@subdomain.example.org") is True
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_no_at(self):
-        """Test validate_contact rejects email without @."""
-        provider = SendGridMessageProvider()
-        assert await provider.validate_contact("invalid") is False
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_no_user(self):
-        """Test validate_contact rejects email without user part."""
-        provider = SendGridMessageProvider()
-        assert await provider.validate_contact("@example.com") is False
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_no_domain(self):
-        """Test validate_contact rejects email without domain."""
-        provider = SendGridMessageProvider()
-        assert await provider.validate_contact("user@") is False
+    @pytest.mark.parametrize(
+        ("email", "expected"),
+        [
+            ("user@example.com", True),
+            ("test.user@subdomain.example.org", True),
+            ("invalid", False),
+            ("@example.com", False),
+            ("user@", False),
+        ],
+        ids=["valid", "subdomain", "no_at", "no_user", "no_domain"],
+    )
+    async def test_validate_contact(self, sg_provider_unconfigured, email, expected):
+        """Test validate_contact accepts well-formed emails and rejects the rest."""
+        assert await sg_provider_unconfigured.validate_contact(email) is expected
 
 
 class TestSendGridSendConsentRequest:
     """Tests for SendGridMessageProvider.send_consent_request method."""
 
-    @pytest.mark.asyncio
-    async def test_send_returns_error_for_invalid_email(self):
+    async def test_send_returns_error_for_invalid_email(self, sg_provider_configured):
         """Test send_consent_request returns error for invalid email."""
-        provider = SendGridMessageProvider(
-            api_key="test_key",
-            from_email="noreply@example.com",
-        )
-
-        result = await provider.send_consent_request(
+        result = await sg_provider_configured.send_consent_request(
             target_contact="invalid",
             requester_name="Alice",
             target_name="Bob",
@@ -104,17 +95,8 @@ class TestSendGridSendConsentRequest:
         assert result.success is False
         assert "invalid" in result.error.lower()
 
-    @pytest.mark.asyncio
-    @patch("consent_mcp.infrastructure.providers.sendgrid.SendGridAPIClient")
-    async def test_send_success(self, mock_client_class):
+    async def test_send_success(self, sendgrid_client):
         """Test send_consent_request sends email via SendGrid."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.headers = {"X-Message-Id": "email123"}
-        mock_client.send.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
         provider = SendGridMessageProvider(
             api_key="test_key",
             from_email="noreply@example.com",
@@ -129,18 +111,10 @@ class TestSendGridSendConsentRequest:
 
         assert result.success is True
         assert result.message_id == "email123"
-        mock_client.send.assert_called_once()
+        assert len(sendgrid_client.calls) == 1
 
-    @pytest.mark.asyncio
-    @patch("consent_mcp.infrastructure.providers.sendgrid.SendGridAPIClient")
-    async def test_send_includes_consent_url_when_provided(self, mock_client_class):
+    async def test_send_includes_consent_url_when_provided(self, sendgrid_client):
         """Test send_consent_request includes consent URL in message."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.headers = {"X-Message-Id": "email123"}
-        mock_client.send.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
         provider = SendGridMessageProvider(
             api_key="test_key",
             from_email="noreply@example.com",
@@ -155,56 +129,62 @@ class TestSendGridSendConsentRequest:
         )
 
         # Verify send was called with proper mail object containing URL
-        mock_client.send.assert_called_once()
+        assert len(sendgrid_client.calls) == 1
+        html = sendgrid_client.calls[0].get()["content"][1]["value"]
+        assert "https://consent.example.com/abc123" in html
 
 
-class TestSendGridEmailFormatting:
-    """Tests for SendGridMessageProvider email formatting."""
-
-    def test_format_html_body_includes_requester(self):
-        """Test HTML body includes requester name."""
-        provider = SendGridMessageProvider()
+class TestSendGridSendBatch:
+    """Tests for SendGridMessageProvider.send_batch method."""
 
-        body = provider._format_html_body(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-            consent_url=None,
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    async def test_send_batch_uses_single_request(self, sendgrid_client, n):
+        """Test send_batch sends all recipients in one SendGrid call."""
+        provider = SendGridMessageProvider(
+            api_key="test_key",
+            from_email="noreply@example.com",
         )
+        recipients = [
+            BatchRecipient(f"user{i}@example.com", f"User {i}", f"https://consent.example.com/{i}")
+            for i in range(n)
+        ]
 
-        assert "Alice" in body
+        results = await provider.send_batch("Alice", "wellness_check", recipients)
 
-    def test_format_html_body_includes_scope(self):
-        """Test HTML body includes scope."""
-        provider = SendGridMessageProvider()
+        assert len(sendgrid_client.calls) == 1
+        assert len(results) == n
+        assert all(r.success for r in results)
+        mail = sendgrid_client.calls[0].get()
+        assert len(mail["personalizations"]) == n
 
-        body = provider._format_html_body(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-            consent_url=None,
+    async def test_send_batch_reports_invalid_emails(self, sendgrid_client):
+        """Test send_batch fails invalid recipients without sending to them."""
+        provider = SendGridMessageProvider(
+            api_key="test_key",
+            from_email="noreply@example.com",
         )
 
-        assert "wellness_check" in body
+        results = await provider.send_batch(
+            "Alice",
+            "wellness_check",
+            [BatchRecipient("bob@example.com", "Bob"), BatchRecipient("invalid")],
+        )
 
-    def test_format_html_body_includes_target_name(self):
-        """Test HTML body includes target name."""
-        provider = SendGridMessageProvider()
+        assert [r.success for r in results] == [True, False]
+        assert len(sendgrid_client.calls) == 1
 
-        body = provider._format_html_body(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-            consent_url=None,
-        )
 
-        assert "Bob" in body
+class TestSendGridEmailFormatting:
+    """Tests for SendGridMessageProvider email formatting."""
 
-    def test_format_html_body_includes_consent_url(self):
-        """Test HTML body includes consent URL when provided."""
-        provider = SendGridMessageProvider()
+    def test_format_html_body_includes_request_details(self, html_body):
+        """Test HTML body includes requester, target name and scope."""
+        for needle in ("Alice", "Bob", "wellness_check"):
+            assert needle in html_body
 
-        body = provider._format_html_body(
+    def test_format_html_body_includes_consent_url(self, sg_provider_unconfigured):
+        """Test HTML body includes consent URL when provided."""
+        body = sg_provider_unconfigured._format_html_body(
             requester_name="Alice",
             target_name="Bob",
             scope="wellness_check",
@@ -213,9 +193,7 @@ class TestSendGridEmailFormatting:
 
         assert "https://consent.example.com/abc123" in body
 
-    def test_format_subject_includes_requester(self):
+    def test_format_subject_includes_requester(self, sg_provider_unconfigured):
         """Test subject includes requester name."""
-        provider = SendGridMessageProvider()
-
-        subject = provider._format_subject("Alice")
+        subject = sg_provider_unconfigured._format_subject("Alice")
         assert "Alice" in subject
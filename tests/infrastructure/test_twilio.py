@@ -1,140 +1,108 @@
 """Tests for TwilioMessageProvider."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from consent_mcp.domain.providers import ProviderType
 from consent_mcp.infrastructure.providers.twilio import TwilioMessageProvider
 
+CREDENTIALS = {
+    "account_sid": "test_sid",
+    "auth_token": "test_token",
+    "phone_number": "+15551234567",
+}
+
+
+@pytest.fixture(scope="module")
+def configured_provider() -> TwilioMessageProvider:
+    """Twilio provider with test credentials; never used to reach the client."""
+    return TwilioMessageProvider(**CREDENTIALS)
+
+
+@pytest.fixture(scope="module")
+def alice_bob_message(twilio_provider_unconfigured) -> str:
+    """SMS body formatted once for the formatting assertions."""
+    return twilio_provider_unconfigured._format_message(
+        requester_name="Alice",
+        target_name="Bob",
+        scope="wellness_check",
+    )
+
+
+@pytest.fixture
+def mock_twilio_client(monkeypatch, twilio_client_factory) -> MagicMock:
+    """Make twilio Client hand out a fresh autospec client for this test."""
+    client = twilio_client_factory()
+    monkeypatch.setattr(
+        "consent_mcp.infrastructure.providers.twilio.Client",
+        lambda *args, **kwargs: client,  # noqa: ARG005
+    )
+    return client
+
 
 class TestTwilioProviderConfiguration:
     """Tests for TwilioMessageProvider configuration."""
 
-    def test_provider_type_is_sms(self):
+    def test_provider_type_is_sms(self, configured_provider):
         """Test that provider type is SMS."""
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
-        assert provider.provider_type == ProviderType.SMS
+        assert configured_provider.provider_type == ProviderType.SMS
 
-    def test_provider_name_is_twilio(self):
+    def test_provider_name_is_twilio(self, twilio_provider_unconfigured):
         """Test that provider name is twilio."""
-        provider = TwilioMessageProvider()
-        assert provider.provider_name == "twilio"
+        assert twilio_provider_unconfigured.provider_name == "twilio"
 
-    def test_is_configured_returns_true_when_all_set(self):
+    def test_is_configured_returns_true_when_all_set(self, configured_provider):
         """Test is_configured returns True when all credentials set."""
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
-        assert provider.is_configured() is True
-
-    def test_is_configured_returns_false_when_account_sid_missing(self):
-        """Test is_configured returns False when account_sid missing."""
-        provider = TwilioMessageProvider(
-            account_sid=None,
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
-        assert provider.is_configured() is False
+        assert configured_provider.is_configured() is True
 
-    def test_is_configured_returns_false_when_auth_token_missing(self):
-        """Test is_configured returns False when auth_token missing."""
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token=None,
-            phone_number="+15551234567",
-        )
-        assert provider.is_configured() is False
-
-    def test_is_configured_returns_false_when_phone_missing(self):
-        """Test is_configured returns False when phone_number missing."""
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number=None,
-        )
+    @pytest.mark.parametrize("missing", ["account_sid", "auth_token", "phone_number"])
+    def test_is_configured_returns_false_when_credential_missing(self, missing):
+        """Test is_configured returns False when any credential is missing."""
+        provider = TwilioMessageProvider(**{**CREDENTIALS, missing: None})
         assert provider.is_configured() is False
 
 
 class TestTwilioContactValidation:
     """Tests for TwilioMessageProvider.validate_contact method."""
 
-    @pytest.mark.asyncio
-    async def test_validate_contact_valid_e164_phone(self):
-        """Test validate_contact accepts valid E.164 phone."""
-        provider = TwilioMessageProvider()
-        assert await provider.validate_contact("+15551234567") is True
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_valid_international_phone(self):
-        """Test validate_contact accepts valid international phone."""
-        provider = TwilioMessageProvider()
-        assert await provider.validate_contact("+447911123456") is True
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_no_plus(self):
-        """Test validate_contact rejects phone without + prefix."""
-        provider = TwilioMessageProvider()
-        assert await provider.validate_contact("5551234567") is False
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_too_short(self):
-        """Test validate_contact rejects too short phone."""
-        provider = TwilioMessageProvider()
-        assert await provider.validate_contact("+1") is False
-
-    @pytest.mark.asyncio
-    async def test_validate_contact_rejects_invalid_chars(self):
-        """Test validate_contact rejects invalid characters."""
-        provider = TwilioMessageProvider()
-        assert await provider.validate_contact("invalid") is False
-        assert await provider.validate_contact("+1555CALL") is False
+    @pytest.mark.parametrize(
+        ("phone", "expected"),
+        [
+            ("+15551234567", True),
+            ("+447911123456", True),
+            ("5551234567", False),
+            ("+1", False),
+            ("invalid", False),
+            ("+1555CALL", False),
+        ],
+        ids=["e164", "international", "no_plus", "too_short", "letters", "mixed_chars"],
+    )
+    async def test_validate_contact(self, twilio_provider_unconfigured, phone, expected):
+        """Test validate_contact accepts E.164 phones and rejects the rest."""
+        assert await twilio_provider_unconfigured.validate_contact(phone) is expected
 
 
 class TestTwilioSendConsentRequest:
     """Tests for TwilioMessageProvider.send_consent_request method."""
 
-    @pytest.mark.asyncio
-    async def test_send_returns_error_for_invalid_phone(self):
+    @pytest.mark.parametrize("phone", ["invalid", "5551234567", "+1", "+1555CALL"])
+    async def test_send_returns_error_for_invalid_phone(self, configured_provider, phone):
         """Test send_consent_request returns error for invalid phone."""
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
-
-        result = await provider.send_consent_request(
-            target_contact="invalid",
+        result = await configured_provider.send_consent_request(
+            target_contact=phone,
             requester_name="Alice",
             target_name="Bob",
             scope="wellness_check",
         )
 
         assert result.success is False
-        assert "invalid" in result.error.lower()
+        assert "invalid" in result.error.casefold()
 
-    @pytest.mark.asyncio
-    @patch("consent_mcp.infrastructure.providers.twilio.Client")
-    async def test_send_success(self, mock_client_class):
+    async def test_send_success(self, mock_twilio_client):
         """Test send_consent_request sends SMS via Twilio."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.sid = "SM123456"
-        mock_client.messages.create.return_value = mock_message
-        mock_client_class.return_value = mock_client
-
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
+        # Fresh provider: the shared one would cache the patched client
+        provider = TwilioMessageProvider(**CREDENTIALS)
 
         result = await provider.send_consent_request(
             target_contact="+15559876543",
@@ -145,23 +113,12 @@ class TestTwilioSendConsentRequest:
 
         assert result.success is True
         assert result.message_id == "SM123456"
-        mock_client.messages.create.assert_called_once()
+        mock_twilio_client.messages.create.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("consent_mcp.infrastructure.providers.twilio.Client")
-    async def test_send_includes_consent_url_when_provided(self, mock_client_class):
+    async def test_send_includes_consent_url_when_provided(self, mock_twilio_client):
         """Test send_consent_request includes consent URL in message."""
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.sid = "SM123456"
-        mock_client.messages.create.return_value = mock_message
-        mock_client_class.return_value = mock_client
-
-        provider = TwilioMessageProvider(
-            account_sid="test_sid",
-            auth_token="test_token",
-            phone_number="+15551234567",
-        )
+        # Fresh provider: the shared one would cache the patched client
+        provider = TwilioMessageProvider(**CREDENTIALS)
 
         await provider.send_consent_request(
             target_contact="+15559876543",
@@ -171,7 +128,7 @@ class TestTwilioSendConsentRequest:
             consent_url="https://consent.example.com/abc123",
         )
 
-        call_args = mock_client.messages.create.call_args
+        call_args = mock_twilio_client.messages.create.call_args
         message_body = call_args[1]["body"]
         assert "https://consent.example.com/abc123" in message_body
 
@@ -179,47 +136,14 @@ class TestTwilioSendConsentRequest:
 class TestTwilioMessageFormatting:
     """Tests for TwilioMessageProvider message formatting."""
 
-    def test_format_message_includes_requester(self):
-        """Test message format includes requester name."""
-        provider = TwilioMessageProvider()
+    def test_format_message_includes_request_details(self, alice_bob_message):
+        """Test message includes requester, target name and scope."""
+        for needle in ("Alice", "Bob", "wellness_check"):
+            assert needle in alice_bob_message
 
-        message = provider._format_message(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-        )
-
-        assert "Alice" in message
-
-    def test_format_message_includes_scope(self):
-        """Test message format includes scope."""
-        provider = TwilioMessageProvider()
-
-        message = provider._format_message(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-        )
-
-        assert "wellness_check" in message
-
-    def test_format_message_includes_target_name(self):
-        """Test message format includes target name."""
-        provider = TwilioMessageProvider()
-
-        message = provider._format_message(
-            requester_name="Alice",
-            target_name="Bob",
-            scope="wellness_check",
-        )
-
-        assert "Bob" in message
-
-    def test_format_message_handles_no_target_name(self):
+    def test_format_message_handles_no_target_name(self, twilio_provider_unconfigured):
         """Test message format handles missing target name."""
-        provider = TwilioMessageProvider()
-
-        message = provider._format_message(
+        message = twilio_provider_unconfigured._format_message(
             requester_name="Alice",
             target_name=None,
             scope="wellness_check",
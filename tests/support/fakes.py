@@ -0,0 +1,168 @@
+"""In-memory fakes for repository-backed tests."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from consent_mcp.domain.entities import ConsentRequest
+from consent_mcp.domain.repository import (
+    DuplicateRequestError,
+    IConsentRepository,
+    RequestNotFoundError,
+)
+from consent_mcp.domain.value_objects import ConsentStatus, ContactInfo
+
+_UniqueKey = tuple[str, str, str, str, str]
+
+
+def _unique_key(request: ConsentRequest) -> _UniqueKey:
+    """Mirror uq_consent_requester_target_scope."""
+    return (
+        request.requester.contact_type.value,
+        request.requester.contact_value,
+        request.target.contact_type.value,
+        request.target.contact_value,
+        request.scope,
+    )
+
+
+class InMemoryConsentRepository(IConsentRepository):
+    """Dict-backed IConsentRepository with the same uniqueness rules as Postgres."""
+
+    def __init__(self, requests: tuple[ConsentRequest, ...] = ()):
+        """
+        Initialize the repository.
+
+        Args:
+            requests: Requests to preload, as if already committed.
+        """
+        self._by_id: dict[UUID, ConsentRequest] = {}
+        self._keys: set[_UniqueKey] = set()
+        for request in requests:
+            self._store(request)
+
+    def _store(self, request: ConsentRequest) -> ConsentRequest:
+        """Store a copy of the request and return another copy."""
+        stored = request.model_copy()
+        self._by_id[stored.id] = stored
+        self._keys.add(_unique_key(stored))
+        return stored.model_copy()
+
+    async def create(self, request: ConsentRequest) -> ConsentRequest:
+        """Create a new consent request."""
+        if _unique_key(request) in self._keys or request.id in self._by_id:
+            raise DuplicateRequestError(
+                "Consent request already exists for this requester+target+scope"
+            )
+        return self._store(request)
+
+    async def create_many(self, requests: list[ConsentRequest]) -> list[ConsentRequest]:
+        """Create several consent requests, all or nothing."""
+        keys = [_unique_key(request) for request in requests]
+        if len(set(keys)) != len(keys) or self._keys.intersection(keys):
+            raise DuplicateRequestError(
+                "Consent request already exists for this requester+target+scope"
+            )
+        return [self._store(request) for request in requests]
+
+    async def get_by_id(self, request_id: UUID) -> ConsentRequest | None:
+        """Get a consent request by ID."""
+        request = self._by_id.get(request_id)
+        return request.model_copy() if request else None
+
+    def _between(self, requester: ContactInfo, target: ContactInfo) -> list[ConsentRequest]:
+        """Return copies of all requests from requester to target."""
+        return [
+            r.model_copy()
+            for r in self._by_id.values()
+            if r.requester == requester and r.target == target
+        ]
+
+    async def get_active_consent(
+        self,
+        requester: ContactInfo,
+        target: ContactInfo,
+        scope: str | None = None,
+    ) -> ConsentRequest | None:
+        """Get active (granted, unexpired) consent."""
+        now = datetime.now(timezone.utc)
+        for request in self._between(requester, target):
+            if (
+                request.status == ConsentStatus.GRANTED
+                and request.expires_at > now
+                and (not scope or request.scope == scope)
+            ):
+                return request
+        return None
+
+    async def get_pending_request(
+        self,
+        requester: ContactInfo,
+        target: ContactInfo,
+        scope: str,
+    ) -> ConsentRequest | None:
+        """Get a pending consent request."""
+        for request in self._between(requester, target):
+            if request.status == ConsentStatus.PENDING and request.scope == scope:
+                return request
+        return None
+
+    async def update_status(
+        self,
+        request_id: UUID,
+        status: ConsentStatus,
+    ) -> ConsentRequest:
+        """Update the status of a consent request."""
+        request = self._by_id.get(request_id)
+        if request is None:
+            raise RequestNotFoundError(f"Consent request not found: {request_id}")
+        now = datetime.now(timezone.utc)
+        updated = request.model_copy(
+            update={
+                "status": status,
+                "updated_at": now,
+                "responded_at": (
+                    now if status in (ConsentStatus.GRANTED, ConsentStatus.REVOKED) else None
+                ),
+            }
+        )
+        self._by_id[request_id] = updated
+        return updated.model_copy()
+
+    async def find_by_target(
+        self,
+        target: ContactInfo,
+        status: ConsentStatus | None = None,
+    ) -> list[ConsentRequest]:
+        """Find all consent requests for a target."""
+        return [
+            r.model_copy()
+            for r in self._by_id.values()
+            if r.target == target and (not status or r.status == status)
+        ]
+
+    async def find_by_requester(
+        self,
+        requester: ContactInfo,
+        status: ConsentStatus | None = None,
+    ) -> list[ConsentRequest]:
+        """Find all consent requests from a requester."""
+        return [
+            r.model_copy()
+            for r in self._by_id.values()
+            if r.requester == requester and (not status or r.status == status)
+        ]
+
+    async def expire_old_requests(self) -> int:
+        """Mark expired requests as EXPIRED status."""
+        now = datetime.now(timezone.utc)
+        expirable = (ConsentStatus.PENDING, ConsentStatus.GRANTED)
+        expired = [
+            request_id
+            for request_id, r in self._by_id.items()
+            if r.status in expirable and r.expires_at <= now
+        ]
+        for request_id in expired:
+            self._by_id[request_id] = self._by_id[request_id].model_copy(
+                update={"status": ConsentStatus.EXPIRED, "updated_at": now}
+            )
+        return len(expired)
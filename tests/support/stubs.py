@@ -0,0 +1,104 @@
+"""Lightweight stub implementations of domain interfaces for tests."""
+
+from typing import Any
+
+from consent_mcp.domain.auth import AuthContext, IAuthProvider
+from consent_mcp.domain.providers import IMessageProvider, MessageDeliveryResult, ProviderType
+
+
+class StubMessageProvider(IMessageProvider):
+    """Message provider that records calls and always succeeds."""
+
+    def __init__(self, provider_type: ProviderType, provider_name: str, message_id: str):
+        """
+        Initialize the stub provider.
+
+        Args:
+            provider_type: Type of provider to report (SMS or EMAIL).
+            provider_name: Name to report in delivery results.
+            message_id: Message ID returned for every send.
+        """
+        self._provider_type = provider_type
+        self._provider_name = provider_name
+        self._message_id = message_id
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    @property
+    def provider_type(self) -> ProviderType:
+        """Return the configured provider type."""
+        return self._provider_type
+
+    @property
+    def provider_name(self) -> str:
+        """Return the configured provider name."""
+        return self._provider_name
+
+    @property
+    def send_consent_request_called_once(self) -> bool:
+        """Check if send_consent_request was called exactly once."""
+        return len(self.calls) == 1
+
+    async def send_consent_request(self, *args: Any, **kwargs: Any) -> MessageDeliveryResult:
+        """Record the call and return a successful delivery."""
+        self.calls.append((args, kwargs))
+        return MessageDeliveryResult(
+            success=True,
+            provider=self._provider_name,
+            message_id=self._message_id,
+        )
+
+    async def validate_contact(self, contact_value: str) -> bool:  # noqa: ARG002
+        """Accept every contact."""
+        return True
+
+    def is_configured(self) -> bool:
+        """Always report as configured."""
+        return True
+
+
+class StubAuthProvider(IAuthProvider):
+    """Auth provider that authenticates every caller as a test client."""
+
+    @property
+    def provider_name(self) -> str:
+        """Return provider name."""
+        return "mock_auth"
+
+    async def authenticate(self, credentials: dict[str, Any]) -> AuthContext | None:  # noqa: ARG002
+        """Return a fixed test client context."""
+        return AuthContext(
+            client_id="test_client",
+            client_name="Test Client",
+            scopes=["*"],
+        )
+
+    def extract_credentials(self, request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG002
+        """Return a fixed test API key."""
+        return {"api_key": "test_key"}
+
+
+class StubSendGridResponse:
+    """Minimal stand-in for a SendGrid API response."""
+
+    def __init__(self, message_id: str):
+        """Initialize with the message ID to report in headers."""
+        self.headers = {"X-Message-Id": message_id}
+
+
+class StubSendGridClient:
+    """SendGridAPIClient stand-in that records sent mail."""
+
+    def __init__(self, message_id: str = "email123"):
+        """
+        Initialize the stub client.
+
+        Args:
+            message_id: Message ID returned for every send.
+        """
+        self._response = StubSendGridResponse(message_id)
+        self.calls: list[Any] = []
+
+    def send(self, mail: Any) -> StubSendGridResponse:
+        """Record the mail and return a successful response."""
+        self.calls.append(mail)
+        return self._response
@@ -0,0 +1,27 @@
+"""Guard against duplicated source modules in the consent_mcp package."""
+
+import hashlib
+from collections import defaultdict
+from pathlib import Path
+
+import consent_mcp
+
+PACKAGE_ROOT = Path(consent_mcp.__file__).parent
+
+
+class TestNoDuplicateModules:
+    """Tests that no two source files share identical content."""
+
+    def test_source_files_are_unique(self):
+        """Test every non-empty module under consent_mcp has unique content."""
+        by_digest: dict[str, list[str]] = defaultdict(list)
+        for path in sorted(PACKAGE_ROOT.rglob("*.py")):
+            source = path.read_bytes().strip()
+            if not source:
+                continue
+            digest = hashlib.sha256(source).hexdigest()
+            by_digest[digest].append(str(path.relative_to(PACKAGE_ROOT)))
+
+        duplicates = [paths for paths in by_digest.values() if len(paths) > 1]
+
+        assert duplicates == []
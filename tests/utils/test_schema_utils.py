@@ -1,97 +1,241 @@
 """Tests for schema_utils - Pydantic to MCP inputSchema conversion."""
 
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Literal
 
+import pytest
 from pydantic import BaseModel, EmailStr, Field
 
+from consent_mcp.mcp.v1.requests import (
+    AdminSimulateV1Request,
+    CheckConsentEmailV1Request,
+    RequestConsentSmsV1Request,
+)
 from consent_mcp.utils.schema_utils import pydantic_to_input_schema
 
 
-class TestPydanticToInputSchema:
-    """Tests for pydantic_to_input_schema function."""
+# ============================================
+# Flat models for the field and structure tests
+# ============================================
+class AnyModel(BaseModel):
+    field: str
 
-    # ============================================
-    # Basic Type Tests
-    # ============================================
 
-    def test_simple_string_field(self):
-        """Test conversion of a simple string field."""
+class BasicTypes(BaseModel):
+    name: str
+    count: int
+    active: bool
+    price: float
 
-        class SimpleModel(BaseModel):
-            name: str
 
-        schema = pydantic_to_input_schema(SimpleModel)
+class DescModel(BaseModel):
+    name: Annotated[str, Field(description="The user's full name")]
+
+
+class TitleModel(BaseModel):
+    user_name: str
+
+
+class MultiDescModel(BaseModel):
+    first: Annotated[str, Field(description="First field")]
+    second: Annotated[int, Field(description="Second field")]
+
+
+class OptionalModel(BaseModel):
+    required_field: str
+    optional_field: str | None = None
+
+
+class OptionalStrModel(BaseModel):
+    maybe_name: str | None = None
+
+
+class OptionalDescModel(BaseModel):
+    maybe_name: Annotated[
+        str | None,
+        Field(default=None, description="An optional name"),
+    ]
+
+
+class DefaultModel(BaseModel):
+    name: str
+    count: int = 10
+
+
+class LiteralModel(BaseModel):
+    status: Literal["pending", "active", "done"]
+
+
+class Status(str, Enum):
+    PENDING = "pending"
+    ACTIVE = "active"
+    DONE = "done"
+
+
+class EnumModel(BaseModel):
+    status: Status
+
+
+class EmailModel(BaseModel):
+    email: EmailStr
+
+
+class ConstrainedModel(BaseModel):
+    age: Annotated[int, Field(ge=0, le=150, description="Age in years")]
+
+
+class LengthModel(BaseModel):
+    code: Annotated[str, Field(min_length=3, max_length=10)]
+
+
+class AllRequiredModel(BaseModel):
+    first: str
+    second: int
+    third: bool
+
+
+class AllOptionalModel(BaseModel):
+    first: str = "default"
+    second: int = 0
+    third: bool = False
+
+
+class MixedModel(BaseModel):
+    required: str
+    optional: str = "default"
+    also_optional: int | None = None
+
+
+class EmptyModel(BaseModel):
+    pass
 
-        assert schema["type"] == "object"
-        assert "name" in schema["properties"]
-        assert schema["properties"]["name"]["type"] == "string"
-        assert "name" in schema["required"]
 
-    def test_simple_integer_field(self):
-        """Test conversion of an integer field."""
+class Tags(BaseModel):
+    tags: list[str]
 
-        class IntModel(BaseModel):
-            count: int
 
-        schema = pydantic_to_input_schema(IntModel)
+# ============================================
+# Nested models shared by the nested property tests
+# ============================================
+class Country(BaseModel):
+    name: str
+    code: str
 
-        assert schema["properties"]["count"]["type"] == "integer"
-        assert "count" in schema["required"]
 
-    def test_simple_boolean_field(self):
-        """Test conversion of a boolean field."""
+class Address(BaseModel):
+    street: Annotated[str, Field(description="Street address")]
+    city: Annotated[str, Field(description="City name")]
+    zip_code: str = "00000"
+    country: Country
 
-        class BoolModel(BaseModel):
-            active: bool
 
-        schema = pydantic_to_input_schema(BoolModel)
+class Person(BaseModel):
+    name: str
+    address: Annotated[Address, Field(description="Person's address")]
+    previous_address: Address | None = None
+    addresses: list[Address]
 
-        assert schema["properties"]["active"]["type"] == "boolean"
 
-    def test_simple_float_field(self):
-        """Test conversion of a float field."""
+class Metadata(BaseModel):
+    created_at: str
+    version: int
+    active: bool
+    tags: list[str]
 
-        class FloatModel(BaseModel):
-            price: float
 
-        schema = pydantic_to_input_schema(FloatModel)
+class Document(BaseModel):
+    title: str
+    metadata: Metadata
 
-        assert schema["properties"]["price"]["type"] == "number"
+
+class AccountStatus(str, Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class Settings(BaseModel):
+    theme: str
+    status: AccountStatus
+
+
+class User(BaseModel):
+    name: str
+    settings: Settings
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int = 1
+
+
+class Order(BaseModel):
+    items: list[Item]
+
+
+NESTED_MODELS = (Person, Document, User, Order)
+
+
+@pytest.fixture(scope="module")
+def schema_cache():
+    """Memoize pydantic_to_input_schema per model class; results are shared, do not mutate."""
+    return lru_cache(maxsize=None)(pydantic_to_input_schema)
+
+
+@pytest.fixture(scope="module")
+def real_schemas(schema_cache):
+    """Schemas of the production request models, built once per module."""
+    return {
+        cls: schema_cache(cls)
+        for cls in (RequestConsentSmsV1Request, CheckConsentEmailV1Request, AdminSimulateV1Request)
+    }
+
+
+@pytest.fixture(scope="module")
+def all_schemas(schema_cache):
+    """Schemas of the shared nested models, built once per module."""
+    return {cls: schema_cache(cls) for cls in NESTED_MODELS}
+
+
+class TestPydanticToInputSchema:
+    """Tests for pydantic_to_input_schema function."""
 
     # ============================================
-    # Field Description Tests
+    # Basic Type Tests
     # ============================================
 
-    def test_field_with_description(self):
-        """Test that Field descriptions are preserved."""
+    @pytest.mark.parametrize(
+        ("field", "json_type"),
+        [("name", "string"), ("count", "integer"), ("active", "boolean"), ("price", "number")],
+    )
+    def test_basic_field_types(self, schema_cache, field, json_type):
+        """Test conversion of basic scalar fields to JSON schema types."""
+        schema = schema_cache(BasicTypes)
 
-        class DescModel(BaseModel):
-            name: Annotated[str, Field(description="The user's full name")]
+        assert schema["type"] == "object"
+        assert schema["properties"][field]["type"] == json_type
+        assert field in schema["required"]
 
-        schema = pydantic_to_input_schema(DescModel)
+    # ============================================
+    # Field Description Tests
+    # ============================================
+
+    def test_field_with_description(self, schema_cache):
+        """Test that Field descriptions are preserved."""
+        schema = schema_cache(DescModel)
 
         assert schema["properties"]["name"]["description"] == "The user's full name"
 
-    def test_field_without_description_uses_title(self):
+    def test_field_without_description_uses_title(self, schema_cache):
         """Test that title is used as fallback description."""
-
-        class TitleModel(BaseModel):
-            user_name: str
-
-        schema = pydantic_to_input_schema(TitleModel)
+        schema = schema_cache(TitleModel)
 
         # Pydantic generates title from field name
         assert "description" in schema["properties"]["user_name"]
 
-    def test_multiple_fields_with_descriptions(self):
+    def test_multiple_fields_with_descriptions(self, schema_cache):
         """Test multiple fields each have their descriptions."""
-
-        class MultiDescModel(BaseModel):
-            first: Annotated[str, Field(description="First field")]
-            second: Annotated[int, Field(description="Second field")]
-
-        schema = pydantic_to_input_schema(MultiDescModel)
+        schema = schema_cache(MultiDescModel)
 
         assert schema["properties"]["first"]["description"] == "First field"
         assert schema["properties"]["second"]["description"] == "Second field"
@@ -100,39 +244,23 @@ class TestPydanticToInputSchema:
     # Optional Field Tests
     # ============================================
 
-    def test_optional_field_not_in_required(self):
+    def test_optional_field_not_in_required(self, schema_cache):
         """Test that Optional fields are not in required list."""
-
-        class OptionalModel(BaseModel):
-            required_field: str
-            optional_field: str | None = None
-
-        schema = pydantic_to_input_schema(OptionalModel)
+        schema = schema_cache(OptionalModel)
 
         assert "required_field" in schema["required"]
         assert "optional_field" not in schema["required"]
 
-    def test_optional_field_type_is_extracted(self):
+    def test_optional_field_type_is_extracted(self, schema_cache):
         """Test that Optional[str] extracts to string type."""
-
-        class OptionalStrModel(BaseModel):
-            maybe_name: str | None = None
-
-        schema = pydantic_to_input_schema(OptionalStrModel)
+        schema = schema_cache(OptionalStrModel)
 
         # Should be string, not the anyOf representation
         assert schema["properties"]["maybe_name"]["type"] == "string"
 
-    def test_optional_field_with_description(self):
+    def test_optional_field_with_description(self, schema_cache):
         """Test that Optional fields preserve description."""
-
-        class OptionalDescModel(BaseModel):
-            maybe_name: Annotated[
-                str | None,
-                Field(default=None, description="An optional name"),
-            ]
-
-        schema = pydantic_to_input_schema(OptionalDescModel)
+        schema = schema_cache(OptionalDescModel)
 
         assert schema["properties"]["maybe_name"]["description"] == "An optional name"
 
@@ -140,14 +268,9 @@ class TestPydanticToInputSchema:
     # Default Value Tests
     # ============================================
 
-    def test_field_with_default_not_required(self):
+    def test_field_with_default_not_required(self, schema_cache):
         """Test that fields with defaults are not required."""
-
-        class DefaultModel(BaseModel):
-            name: str
-            count: int = 10
-
-        schema = pydantic_to_input_schema(DefaultModel)
+        schema = schema_cache(DefaultModel)
 
         assert "name" in schema["required"]
         assert "count" not in schema["required"]
@@ -156,29 +279,16 @@ class TestPydanticToInputSchema:
     # Enum Tests
     # ============================================
 
-    def test_string_literal_enum(self):
+    def test_string_literal_enum(self, schema_cache):
         """Test Literal types generate enum constraint."""
-
-        class LiteralModel(BaseModel):
-            status: Literal["pending", "active", "done"]
-
-        schema = pydantic_to_input_schema(LiteralModel)
+        schema = schema_cache(LiteralModel)
 
         assert "enum" in schema["properties"]["status"]
         assert schema["properties"]["status"]["enum"] == ["pending", "active", "done"]
 
-    def test_python_enum_type(self):
+    def test_python_enum_type(self, schema_cache):
         """Test Python Enum generates enum constraint."""
-
-        class Status(str, Enum):
-            PENDING = "pending"
-            ACTIVE = "active"
-            DONE = "done"
-
-        class EnumModel(BaseModel):
-            status: Status
-
-        schema = pydantic_to_input_schema(EnumModel)
+        schema = schema_cache(EnumModel)
 
         # The enum values should be present
         assert "enum" in schema["properties"]["status"]
@@ -188,37 +298,25 @@ class TestPydanticToInputSchema:
     # Complex Field Tests
     # ============================================
 
-    def test_email_field(self):
+    def test_email_field(self, schema_cache):
         """Test EmailStr field converts to string with format."""
-
-        class EmailModel(BaseModel):
-            email: EmailStr
-
-        schema = pydantic_to_input_schema(EmailModel)
+        schema = schema_cache(EmailModel)
 
         assert schema["properties"]["email"]["type"] == "string"
         assert schema["properties"]["email"]["format"] == "email"
 
-    def test_constrained_integer(self):
+    def test_constrained_integer(self, schema_cache):
         """Test integer with constraints preserves them."""
-
-        class ConstrainedModel(BaseModel):
-            age: Annotated[int, Field(ge=0, le=150, description="Age in years")]
-
-        schema = pydantic_to_input_schema(ConstrainedModel)
+        schema = schema_cache(ConstrainedModel)
 
         # Note: ge/le become minimum/maximum in JSON schema
         prop = schema["properties"]["age"]
         assert prop["type"] == "integer"
         assert prop["description"] == "Age in years"
 
-    def test_constrained_string_length(self):
+    def test_constrained_string_length(self, schema_cache):
         """Test string with length constraints."""
-
-        class LengthModel(BaseModel):
-            code: Annotated[str, Field(min_length=3, max_length=10)]
-
-        schema = pydantic_to_input_schema(LengthModel)
+        schema = schema_cache(LengthModel)
 
         prop = schema["properties"]["code"]
         assert prop["type"] == "string"
@@ -227,39 +325,21 @@ class TestPydanticToInputSchema:
     # Required Fields Tests
     # ============================================
 
-    def test_all_required_fields(self):
+    def test_all_required_fields(self, schema_cache):
         """Test model with all required fields."""
+        schema = schema_cache(AllRequiredModel)
 
-        class AllRequiredModel(BaseModel):
-            first: str
-            second: int
-            third: bool
+        assert sorted(schema["required"]) == ["first", "second", "third"]
 
-        schema = pydantic_to_input_schema(AllRequiredModel)
-
-        assert set(schema["required"]) == {"first", "second", "third"}
-
-    def test_no_required_fields(self):
+    def test_no_required_fields(self, schema_cache):
         """Test model with no required fields."""
-
-        class AllOptionalModel(BaseModel):
-            first: str = "default"
-            second: int = 0
-            third: bool = False
-
-        schema = pydantic_to_input_schema(AllOptionalModel)
+        schema = schema_cache(AllOptionalModel)
 
         assert schema["required"] == []
 
-    def test_mixed_required_optional(self):
+    def test_mixed_required_optional(self, schema_cache):
         """Test model with mix of required and optional."""
-
-        class MixedModel(BaseModel):
-            required: str
-            optional: str = "default"
-            also_optional: int | None = None
-
-        schema = pydantic_to_input_schema(MixedModel)
+        schema = schema_cache(MixedModel)
 
         assert schema["required"] == ["required"]
 
@@ -267,43 +347,17 @@ class TestPydanticToInputSchema:
     # Schema Structure Tests
     # ============================================
 
-    def test_schema_has_object_type(self):
-        """Test schema always has type: object."""
-
-        class AnyModel(BaseModel):
-            field: str
-
-        schema = pydantic_to_input_schema(AnyModel)
+    def test_schema_structural_invariants(self, schema_cache):
+        """Test schema always has type: object, properties and required keys."""
+        schema = schema_cache(AnyModel)
 
         assert schema["type"] == "object"
-
-    def test_schema_has_properties_key(self):
-        """Test schema always has properties key."""
-
-        class AnyModel(BaseModel):
-            field: str
-
-        schema = pydantic_to_input_schema(AnyModel)
-
         assert "properties" in schema
-
-    def test_schema_has_required_key(self):
-        """Test schema always has required key."""
-
-        class AnyModel(BaseModel):
-            field: str
-
-        schema = pydantic_to_input_schema(AnyModel)
-
         assert "required" in schema
 
-    def test_empty_model(self):
+    def test_empty_model(self, schema_cache):
         """Test empty model generates valid schema."""
-
-        class EmptyModel(BaseModel):
-            pass
-
-        schema = pydantic_to_input_schema(EmptyModel)
+        schema = schema_cache(EmptyModel)
 
         assert schema["type"] == "object"
         assert schema["properties"] == {}
@@ -313,11 +367,9 @@ class TestPydanticToInputSchema:
     # Real-world Request Model Tests
     # ============================================
 
-    def test_consent_sms_request_schema(self):
+    def test_consent_sms_request_schema(self, real_schemas):
         """Test the actual RequestConsentSmsV1Request schema generation."""
-        from consent_mcp.mcp.v1.requests import RequestConsentSmsV1Request
-
-        schema = pydantic_to_input_schema(RequestConsentSmsV1Request)
+        schema = real_schemas[RequestConsentSmsV1Request]
 
         # Check structure
         assert schema["type"] == "object"
@@ -340,22 +392,18 @@ class TestPydanticToInputSchema:
         assert "description" in schema["properties"]["requester_phone"]
         assert "description" in schema["properties"]["scope"]
 
-    def test_check_consent_email_request_schema(self):
+    def test_check_consent_email_request_schema(self, real_schemas):
         """Test CheckConsentEmailV1Request schema generation."""
-        from consent_mcp.mcp.v1.requests import CheckConsentEmailV1Request
-
-        schema = pydantic_to_input_schema(CheckConsentEmailV1Request)
+        schema = real_schemas[CheckConsentEmailV1Request]
 
         assert "requester_email" in schema["properties"]
         assert "target_email" in schema["properties"]
         assert schema["properties"]["requester_email"]["type"] == "string"
         assert schema["properties"]["requester_email"]["format"] == "email"
 
-    def test_admin_simulate_request_schema(self):
+    def test_admin_simulate_request_schema(self, real_schemas):
         """Test AdminSimulateV1Request schema generation."""
-        from consent_mcp.mcp.v1.requests import AdminSimulateV1Request
-
-        schema = pydantic_to_input_schema(AdminSimulateV1Request)
+        schema = real_schemas[AdminSimulateV1Request]
 
         assert "target_contact_type" in schema["properties"]
         assert "target_contact_value" in schema["properties"]
@@ -369,19 +417,9 @@ class TestPydanticToInputSchema:
     # Nested Property Tests
     # ============================================
 
-    def test_nested_object_field(self):
+    def test_nested_object_field(self, all_schemas):
         """Test that nested objects are properly converted."""
-
-        class Address(BaseModel):
-            street: str
-            city: str
-            zip_code: str
-
-        class Person(BaseModel):
-            name: str
-            address: Address
-
-        schema = pydantic_to_input_schema(Person)
+        schema = all_schemas[Person]
 
         # Check structure
         assert "address" in schema["properties"]
@@ -394,39 +432,18 @@ class TestPydanticToInputSchema:
         assert "city" in address_schema["properties"]
         assert "zip_code" in address_schema["properties"]
 
-    def test_nested_object_preserves_nested_required(self):
+    def test_nested_object_preserves_nested_required(self, all_schemas):
         """Test that nested object preserves its required fields."""
-
-        class Address(BaseModel):
-            street: str
-            city: str
-            zip_code: str = "00000"  # Optional with default
-
-        class Person(BaseModel):
-            name: str
-            address: Address
-
-        schema = pydantic_to_input_schema(Person)
-
-        address_schema = schema["properties"]["address"]
+        address_schema = all_schemas[Person]["properties"]["address"]
 
         # Nested required should include street and city, not zip_code
         assert "street" in address_schema["required"]
         assert "city" in address_schema["required"]
         assert "zip_code" not in address_schema["required"]
 
-    def test_nested_object_preserves_descriptions(self):
+    def test_nested_object_preserves_descriptions(self, all_schemas):
         """Test that nested object fields preserve descriptions."""
-
-        class Address(BaseModel):
-            street: Annotated[str, Field(description="Street address")]
-            city: Annotated[str, Field(description="City name")]
-
-        class Person(BaseModel):
-            name: str
-            address: Annotated[Address, Field(description="Person's address")]
-
-        schema = pydantic_to_input_schema(Person)
+        schema = all_schemas[Person]
 
         # Top-level field description
         assert schema["properties"]["address"]["description"] == "Person's address"
@@ -436,54 +453,30 @@ class TestPydanticToInputSchema:
         assert address_schema["properties"]["street"]["description"] == "Street address"
         assert address_schema["properties"]["city"]["description"] == "City name"
 
-    def test_optional_nested_object(self):
+    def test_optional_nested_object(self, all_schemas):
         """Test Optional nested object is handled correctly."""
+        schema = all_schemas[Person]
 
-        class Address(BaseModel):
-            street: str
-            city: str
-
-        class Person(BaseModel):
-            name: str
-            address: Address | None = None
-
-        schema = pydantic_to_input_schema(Person)
-
-        # address should not be required
-        assert "address" not in schema["required"]
+        # previous_address should not be required
+        assert "previous_address" not in schema["required"]
 
         # But should still have proper nested structure
-        address_schema = schema["properties"]["address"]
+        address_schema = schema["properties"]["previous_address"]
         assert address_schema["type"] == "object"
         assert "street" in address_schema["properties"]
 
-    def test_array_of_primitives(self):
+    def test_array_of_primitives(self, schema_cache):
         """Test array of primitive types."""
-
-        class Tags(BaseModel):
-            tags: list[str]
-
-        schema = pydantic_to_input_schema(Tags)
+        schema = schema_cache(Tags)
 
         tags_schema = schema["properties"]["tags"]
         assert tags_schema["type"] == "array"
         assert tags_schema["items"]["type"] == "string"
 
-    def test_array_of_objects(self):
+    def test_array_of_objects(self, all_schemas):
         """Test array of nested objects."""
-
-        class Address(BaseModel):
-            street: str
-            city: str
-
-        class Person(BaseModel):
-            name: str
-            addresses: list[Address]
-
-        schema = pydantic_to_input_schema(Person)
-
         # Check array structure
-        addresses_schema = schema["properties"]["addresses"]
+        addresses_schema = all_schemas[Person]["properties"]["addresses"]
         assert addresses_schema["type"] == "array"
 
         # Check items are objects
@@ -492,25 +485,10 @@ class TestPydanticToInputSchema:
         assert "street" in items_schema["properties"]
         assert "city" in items_schema["properties"]
 
-    def test_deeply_nested_objects(self):
+    def test_deeply_nested_objects(self, all_schemas):
         """Test deeply nested objects (3 levels)."""
-
-        class Country(BaseModel):
-            name: str
-            code: str
-
-        class Address(BaseModel):
-            street: str
-            country: Country
-
-        class Person(BaseModel):
-            name: str
-            address: Address
-
-        schema = pydantic_to_input_schema(Person)
-
         # Navigate to deeply nested
-        address_schema = schema["properties"]["address"]
+        address_schema = all_schemas[Person]["properties"]["address"]
         assert address_schema["type"] == "object"
 
         country_schema = address_schema["properties"]["country"]
@@ -518,62 +496,24 @@ class TestPydanticToInputSchema:
         assert "name" in country_schema["properties"]
         assert "code" in country_schema["properties"]
 
-    def test_nested_with_mixed_types(self):
+    def test_nested_with_mixed_types(self, all_schemas):
         """Test nested objects with various field types."""
-
-        class Metadata(BaseModel):
-            created_at: str
-            version: int
-            active: bool
-            tags: list[str]
-
-        class Document(BaseModel):
-            title: str
-            metadata: Metadata
-
-        schema = pydantic_to_input_schema(Document)
-
-        metadata_schema = schema["properties"]["metadata"]
+        metadata_schema = all_schemas[Document]["properties"]["metadata"]
         assert metadata_schema["type"] == "object"
         assert metadata_schema["properties"]["created_at"]["type"] == "string"
         assert metadata_schema["properties"]["version"]["type"] == "integer"
         assert metadata_schema["properties"]["active"]["type"] == "boolean"
         assert metadata_schema["properties"]["tags"]["type"] == "array"
 
-    def test_nested_object_with_enum(self):
+    def test_nested_object_with_enum(self, all_schemas):
         """Test nested object containing an enum field."""
-
-        class Status(str, Enum):
-            ACTIVE = "active"
-            INACTIVE = "inactive"
-
-        class Settings(BaseModel):
-            theme: str
-            status: Status
-
-        class User(BaseModel):
-            name: str
-            settings: Settings
-
-        schema = pydantic_to_input_schema(User)
-
-        settings_schema = schema["properties"]["settings"]
+        settings_schema = all_schemas[User]["properties"]["settings"]
         assert "status" in settings_schema["properties"]
         assert "enum" in settings_schema["properties"]["status"]
 
-    def test_array_of_optional_objects(self):
+    def test_array_of_optional_objects(self, all_schemas):
         """Test array with optional object items."""
-
-        class Item(BaseModel):
-            name: str
-            quantity: int = 1
-
-        class Order(BaseModel):
-            items: list[Item]
-
-        schema = pydantic_to_input_schema(Order)
-
-        items_schema = schema["properties"]["items"]
+        items_schema = all_schemas[Order]["properties"]["items"]
         assert items_schema["type"] == "array"
 
         item_schema = items_schema["items"]
@@ -0,0 +1,97 @@
+"""Web test fixtures."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from consent_mcp.domain.entities import ConsentRequest
+from consent_mcp.domain.value_objects import ConsentStatus, ContactInfo, ContactType
+from consent_mcp.web.app import ConsentWebApp
+
+
+# ============================================
+# Service stand-in
+# ============================================
+@pytest.fixture(scope="session")
+def shared_service():
+    """Create a consent service stand-in with only the methods the routes call."""
+    return SimpleNamespace(
+        get_request_by_id=AsyncMock(),
+        grant_consent=AsyncMock(),
+        deny_consent=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def mock_service(shared_service):
+    """The shared service stand-in, cleared of calls and results from earlier tests."""
+    for method in vars(shared_service).values():
+        method.reset_mock(return_value=True, side_effect=True)
+    return shared_service
+
+
+# ============================================
+# Sample consent request
+# ============================================
+@pytest.fixture(scope="session")
+def sample_consent_request(frozen_now):
+    """Create a sample consent request shared by every test; do not mutate."""
+    return ConsentRequest(
+        id=uuid4(),
+        requester=ContactInfo(
+            contact_type=ContactType.EMAIL,
+            contact_value="requester@example.com",
+            name="Test Requester",
+        ),
+        target=ContactInfo(
+            contact_type=ContactType.EMAIL,
+            contact_value="target@example.com",
+            name="Test User",
+        ),
+        scope="AI agent communication for customer support",
+        status=ConsentStatus.PENDING,
+        expires_at=frozen_now + timedelta(days=7),
+    )
+
+
+class ConsentPaths(NamedTuple):
+    """Endpoint paths for one consent token."""
+
+    show: str
+    grant: str
+    deny: str
+
+
+@pytest.fixture(scope="session")
+def sample_paths(sample_consent_request) -> ConsentPaths:
+    """Endpoint paths for the sample consent request, formatted once."""
+    base = f"/v1/consent/{sample_consent_request.id}"
+    return ConsentPaths(show=base, grant=f"{base}/grant", deny=f"{base}/deny")
+
+
+@pytest.fixture
+def mutable_consent_request(sample_consent_request):
+    """Copy of the sample consent request that a test may modify."""
+    return sample_consent_request.model_copy()
+
+
+# ============================================
+# App and client
+# ============================================
+@pytest.fixture(scope="session")
+def web_app(shared_service):
+    """Create a test web app."""
+    return ConsentWebApp(shared_service)
+
+
+@pytest.fixture(scope="session")
+async def client(web_app):
+    """Create an in-process ASGI test client."""
+    transport = httpx.ASGITransport(app=web_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
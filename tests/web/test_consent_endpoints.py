@@ -1,245 +1,227 @@
 """Tests for consent web endpoints."""
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-
-from consent_mcp.domain.entities import ConsentRequest
-from consent_mcp.domain.services import ConsentService
-from consent_mcp.domain.value_objects import (
-    ConsentActionResult,
-    ConsentStatus,
-    ContactInfo,
-    ContactType,
-)
-from consent_mcp.web.app import ConsentWebApp, create_app
-
-
-@pytest.fixture
-def mock_service():
-    """Create a mock consent service."""
-    return MagicMock(spec=ConsentService)
-
-
-@pytest.fixture
-def sample_consent_request():
-    """Create a sample consent request for testing."""
-    return ConsentRequest(
-        id=uuid4(),
-        requester=ContactInfo(
-            contact_type=ContactType.EMAIL,
-            contact_value="requester@example.com",
-            name="Test Requester",
-        ),
-        target=ContactInfo(
-            contact_type=ContactType.EMAIL,
-            contact_value="target@example.com",
-            name="Test User",
-        ),
-        scope="AI agent communication for customer support",
-        status=ConsentStatus.PENDING,
-        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
-    )
-
 
-@pytest.fixture
-def web_app(mock_service):
-    """Create a test web app."""
-    return ConsentWebApp(mock_service)
+from consent_mcp.domain.value_objects import ConsentActionResult, ConsentStatus
+from consent_mcp.web.app import create_app
 
-
-@pytest.fixture
-def client(web_app):
-    """Create a test client."""
-    return TestClient(web_app.app)
+_GRANT_OK = ConsentActionResult(
+    success=True, new_status=ConsentStatus.GRANTED, message="Consent granted"
+)
+_GRANT_ALREADY = ConsentActionResult(
+    success=False, new_status=ConsentStatus.GRANTED, message="Request already granted"
+)
+_NOT_FOUND = ConsentActionResult(
+    success=False, new_status=None, message="Consent request not found"
+)
+_DENY_OK = ConsentActionResult(
+    success=True, new_status=ConsentStatus.REVOKED, message="Consent denied"
+)
+_DENY_ALREADY = ConsentActionResult(
+    success=False, new_status=ConsentStatus.REVOKED, message="Request already revoked"
+)
 
 
 class TestConsentPageDisplay:
     """Tests for GET /v1/consent/{token} endpoint."""
 
-    def test_shows_consent_page_for_pending_request(
-        self, client, mock_service, sample_consent_request
+    async def test_shows_consent_page_for_pending_request(
+        self, client, mock_service, sample_consent_request, sample_paths
     ):
         """Pending requests should show the consent confirmation page."""
-        mock_service.get_request_by_id = AsyncMock(return_value=sample_consent_request)
+        mock_service.get_request_by_id.return_value = sample_consent_request
 
-        response = client.get(f"/v1/consent/{sample_consent_request.id}")
+        response = await client.get(sample_paths.show)
 
         assert response.status_code == 200
-        assert "Consent Request" in response.text
-        assert "Test Requester" in response.text
-        assert "customer support" in response.text
-        assert "Grant Consent" in response.text
-        assert "Decline" in response.text
-
-    def test_shows_greeting_with_target_name(self, client, mock_service, sample_consent_request):
+        body = response.content
+        assert b"Consent Request" in body
+        assert b"Test Requester" in body
+        assert b"customer support" in body
+        assert b"Grant Consent" in body
+        assert b"Decline" in body
+
+    async def test_shows_greeting_with_target_name(
+        self, client, mock_service, sample_consent_request, sample_paths
+    ):
         """Should greet the target by name if available."""
-        mock_service.get_request_by_id = AsyncMock(return_value=sample_consent_request)
+        mock_service.get_request_by_id.return_value = sample_consent_request
 
-        response = client.get(f"/v1/consent/{sample_consent_request.id}")
+        response = await client.get(sample_paths.show)
 
-        assert "Test User" in response.text
+        assert b"Test User" in response.content
 
-    def test_shows_already_responded_for_granted_request(
-        self, client, mock_service, sample_consent_request
+    async def test_escapes_user_supplied_fields(
+        self, client, mock_service, mutable_consent_request, sample_paths
     ):
-        """Already granted requests should show appropriate message."""
-        sample_consent_request.status = ConsentStatus.GRANTED
-        mock_service.get_request_by_id = AsyncMock(return_value=sample_consent_request)
+        """User-supplied names and scope should be HTML-escaped."""
+        mutable_consent_request.requester = mutable_consent_request.requester.model_copy(
+            update={"name": "<script>alert(1)</script>"}
+        )
+        mock_service.get_request_by_id.return_value = mutable_consent_request
 
-        response = client.get(f"/v1/consent/{sample_consent_request.id}")
+        response = await client.get(sample_paths.show)
 
-        assert response.status_code == 200
-        assert "Already Responded" in response.text
-        assert "granted" in response.text.lower()
+        body = response.content
+        assert b"<script>" not in body
+        assert b"&lt;script&gt;" in body
 
-    def test_shows_already_responded_for_revoked_request(
-        self, client, mock_service, sample_consent_request
+    @pytest.mark.parametrize("status", [ConsentStatus.GRANTED, ConsentStatus.REVOKED])
+    async def test_shows_already_responded(
+        self, client, mock_service, sample_consent_request, sample_paths, status
     ):
-        """Already revoked requests should show appropriate message."""
-        sample_consent_request.status = ConsentStatus.REVOKED
-        mock_service.get_request_by_id = AsyncMock(return_value=sample_consent_request)
+        """Already responded requests should show a page naming their status."""
+        mock_service.get_request_by_id.return_value = sample_consent_request.model_copy(
+            update={"status": status}
+        )
 
-        response = client.get(f"/v1/consent/{sample_consent_request.id}")
+        response = await client.get(sample_paths.show)
 
         assert response.status_code == 200
-        assert "Already Responded" in response.text
+        body = response.content
+        assert b"Already Responded" in body
+        assert status.value.encode() in body.lower()
 
-    def test_returns_404_for_unknown_token(self, client, mock_service):
+    async def test_returns_404_for_unknown_token(self, client, mock_service):
         """Unknown tokens should return 404."""
-        mock_service.get_request_by_id = AsyncMock(return_value=None)
+        mock_service.get_request_by_id.return_value = None
 
-        response = client.get(f"/v1/consent/{uuid4()}")
+        response = await client.get(f"/v1/consent/{uuid4()}")
 
         assert response.status_code == 404
 
-    def test_returns_400_for_invalid_token_format(self, client):
-        """Invalid token formats should return 400."""
-        response = client.get("/v1/consent/not-a-uuid")
-
-        assert response.status_code == 400
-        assert "Invalid consent token" in response.text
-
-
-class TestGrantConsent:
-    """Tests for POST /v1/consent/{token}/grant endpoint."""
-
-    def test_grants_pending_request(self, client, mock_service, sample_consent_request):
-        """Should grant consent for pending requests."""
-        mock_service.grant_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=True,
-                new_status=ConsentStatus.GRANTED,
-                message="Consent granted",
-            )
-        )
 
-        response = client.post(f"/v1/consent/{sample_consent_request.id}/grant")
+class TestConsentActions:
+    """Tests for POST /v1/consent/{token}/grant and /deny endpoints."""
 
-        assert response.status_code == 200
-        assert "Consent Granted" in response.text
-        assert "Thank you" in response.text
-
-    def test_returns_already_responded_for_granted_request(
-        self, client, mock_service, sample_consent_request
+    @pytest.mark.parametrize(
+        ("action", "result", "needles"),
+        [
+            ("grant", _GRANT_OK, (b"Consent Granted", b"Thank you")),
+            ("grant", _GRANT_ALREADY, (b"Already Responded",)),
+            ("deny", _DENY_OK, (b"Consent Declined",)),
+            ("deny", _DENY_ALREADY, (b"Already Responded",)),
+        ],
+        ids=["grant_pending", "grant_already_granted", "deny_pending", "deny_already_revoked"],
+    )
+    async def test_consent_action(
+        self, client, mock_service, sample_paths, action, result, needles
     ):
-        """Should not allow granting already granted requests."""
-        mock_service.grant_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=False,
-                new_status=ConsentStatus.GRANTED,
-                message="Request already granted",
-            )
-        )
+        """Pending requests get a thank you page, responded ones an already-responded page."""
+        getattr(mock_service, f"{action}_consent").return_value = result
 
-        response = client.post(f"/v1/consent/{sample_consent_request.id}/grant")
+        response = await client.post(getattr(sample_paths, action))
 
         assert response.status_code == 200
-        assert "Already Responded" in response.text
+        for needle in needles:
+            assert needle in response.content
 
-    def test_returns_404_for_unknown_token(self, client, mock_service):
+    @pytest.mark.parametrize("action", ["grant", "deny"])
+    async def test_returns_404_for_unknown_token(self, client, mock_service, action):
         """Unknown tokens should return 404."""
-        mock_service.grant_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=False,
-                new_status=None,
-                message="Consent request not found",
-            )
-        )
+        getattr(mock_service, f"{action}_consent").return_value = _NOT_FOUND
 
-        response = client.post(f"/v1/consent/{uuid4()}/grant")
+        response = await client.post(f"/v1/consent/{uuid4()}/{action}")
 
         assert response.status_code == 404
 
-    def test_returns_400_for_invalid_token_format(self, client):
+
+class TestInvalidTokenFormat:
+    """Tests for malformed tokens, which are rejected before the service is called."""
+
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("GET", "/v1/consent/not-a-uuid"),
+            ("POST", "/v1/consent/not-a-uuid/grant"),
+            ("POST", "/v1/consent/not-a-uuid/deny"),
+        ],
+        ids=["show", "grant", "deny"],
+    )
+    async def test_returns_400_for_invalid_token_format(self, client, method, path):
         """Invalid token formats should return 400."""
-        response = client.post("/v1/consent/not-a-uuid/grant")
+        response = await client.request(method, path)
 
         assert response.status_code == 400
+        assert b"Invalid consent token" in response.content
 
 
-class TestDenyConsent:
-    """Tests for POST /v1/consent/{token}/deny endpoint."""
+class TestGrantConsentEncoding:
+    """Tests for content negotiation on POST /v1/consent/{token}/grant."""
 
-    def test_denies_pending_request(self, client, mock_service, sample_consent_request):
-        """Should deny consent for pending requests."""
-        mock_service.deny_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=True,
-                new_status=ConsentStatus.REVOKED,
-                message="Consent denied",
-            )
+    async def test_serves_gzip_when_accepted(self, client, mock_service, sample_paths):
+        """Clients accepting gzip should get the precompressed page."""
+        mock_service.grant_consent.return_value = _GRANT_OK
+
+        response = await client.post(
+            sample_paths.grant,
+            headers={"Accept-Encoding": "gzip"},
         )
 
-        response = client.post(f"/v1/consent/{sample_consent_request.id}/deny")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert b"Consent Granted" in response.content
 
-        assert response.status_code == 200
-        assert "Consent Declined" in response.text
+    async def test_serves_identity_when_gzip_not_accepted(self, client, mock_service, sample_paths):
+        """Clients not accepting gzip should get the uncompressed page."""
+        mock_service.grant_consent.return_value = _GRANT_OK
 
-    def test_returns_already_responded_for_revoked_request(
-        self, client, mock_service, sample_consent_request
-    ):
-        """Should not allow denying already revoked requests."""
-        mock_service.deny_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=False,
-                new_status=ConsentStatus.REVOKED,
-                message="Request already revoked",
-            )
+        response = await client.post(
+            sample_paths.grant,
+            headers={"Accept-Encoding": "identity"},
         )
 
-        response = client.post(f"/v1/consent/{sample_consent_request.id}/deny")
+        assert "content-encoding" not in response.headers
+        assert b"Consent Granted" in response.content
+
+
+class TestStylesheet:
+    """Tests for GET /v1/consent/static/consent.css endpoint."""
+
+    async def test_serves_stylesheet_with_cache_headers(self, client):
+        """Stylesheet should be served as immutable CSS with an ETag."""
+        response = await client.get("/v1/consent/static/consent.css")
 
         assert response.status_code == 200
-        assert "Already Responded" in response.text
+        assert response.headers["content-type"].startswith("text/css")
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith('W/"')
 
-    def test_returns_404_for_unknown_token(self, client, mock_service):
-        """Unknown tokens should return 404."""
-        mock_service.deny_consent = AsyncMock(
-            return_value=ConsentActionResult(
-                success=False,
-                new_status=None,
-                message="Consent request not found",
-            )
+    async def test_returns_304_for_matching_etag(self, client):
+        """Conditional requests with the current ETag should return 304."""
+        etag = (await client.get("/v1/consent/static/consent.css")).headers["etag"]
+
+        response = await client.get(
+            "/v1/consent/static/consent.css", headers={"If-None-Match": etag}
         )
 
-        response = client.post(f"/v1/consent/{uuid4()}/deny")
+        assert response.status_code == 304
 
-        assert response.status_code == 404
+    async def test_pages_link_stylesheet(
+        self, client, mock_service, sample_consent_request, sample_paths
+    ):
+        """Pages should link the stylesheet instead of inlining CSS."""
+        mock_service.get_request_by_id.return_value = sample_consent_request
+
+        response = await client.get(sample_paths.show)
+
+        body = response.content
+        assert b"/v1/consent/static/consent.css?v=" in body
+        assert b"<style>" not in body
 
 
 class TestHealthCheck:
     """Tests for GET /health endpoint."""
 
-    def test_returns_healthy_status(self, client):
+    async def test_returns_healthy_status(self, client):
         """Health check should return healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy"}
+        assert orjson.loads(response.content) == {"status": "healthy"}
 
 
 class TestCreateAppFactory: